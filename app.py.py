@@ -3,38 +3,46 @@ YouTube Analyzer - Main Application
 Transcribe and analyze YouTube videos and documents using OpenAI's Whisper and GPT.
 """
 # Standard library imports
+import atexit
+import gc
+import hashlib
 import html
 import io
-import json
 import logging
 import os
+import queue
 import random
 import re
 import shutil
+import socket
+import subprocess
 import sys
+import threading
 import unicodedata
 import time
-import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
-from urllib.parse import urlparse, parse_qs
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple, TypeVar, Union
+from urllib.parse import unquote_plus, urlparse
 
 # Third-party imports
-import chardet
-import docx
-import PyPDF2
+# (heavy extractors, yt-dlp and faster-whisper are imported inside the functions
+# that use them so a cold start only pays for what the first page needs)
+import httpx
+import orjson
 import streamlit as st
-import yt_dlp
 from dotenv import load_dotenv
-from openai import OpenAI
-from pydub import AudioSegment
-from faster_whisper import WhisperModel
+from openai import DefaultHttpxClient, OpenAI
 from sidebar_ops import record_sidebar_operation
 from telemetry import evaluate_health_alerts
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -48,6 +56,30 @@ VALID_YOUTUBE_DOMAINS = frozenset([
     'm.youtube.com'
 ])
 
+# Bytes of a text upload inspected for encoding detection
+_ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Precompiled patterns for hot string sanitizers
+_SAFE_FILENAME_RE = re.compile(r"[a-zA-Z0-9_\-]+")
+_SAFE_FILENAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_FORBIDDEN_PATH_RE = re.compile(r'\.\.|[/\\\x00]')  # Traversal patterns and null bytes
+_SCRIPT_PATTERN_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'javascript:',
+        r'on\w+\s*=',  # Event handlers like onclick=, onerror=
+        r'<script',
+        r'</script>',
+        r'eval\s*\(',
+        r'expression\s*\(',
+    )
+)
+_VIDEO_ID_PARAM_RE = re.compile(r'(?:^|&)v=([^&]+)')
+_VIDEO_ID_RE = re.compile(r'[A-Za-z0-9_-]{11}')
+_MULTI_SPACE_RE = re.compile(r' +')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
 # -----------------------------
 # CUSTOM EXCEPTIONS
 # -----------------------------
@@ -86,6 +118,11 @@ class APIConnectionError(YouTubeAnalyzerError):
     pass
 
 
+class ProjectInProgressError(YouTubeAnalyzerError):
+    """The same submission is already being processed into its project directory."""
+    pass
+
+
 # -----------------------------
 # LOGGING CONFIGURATION
 # -----------------------------
@@ -101,28 +138,56 @@ if sys.platform == 'win32':
                 # If reconfigure is unavailable or fails, continue gracefully
                 pass
 
-# Configure logging with rotation to prevent log files from growing too large
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        RotatingFileHandler(
-            'app.log',
-            maxBytes=10*1024*1024,  # 10MB max file size
-            backupCount=3,  # Keep 3 backup files
-            encoding='utf-8'
-        ),
-        logging.StreamHandler()
-    ]
-)
+class _ConsoleSafeFormatter(logging.Formatter):
+    """Formatter that drops characters (e.g. emoji) the console encoding cannot represent."""
+    
+    def __init__(self, fmt: str, encoding: str):
+        super().__init__(fmt)
+        self._encoding = encoding
+    
+    def format(self, record: logging.LogRecord) -> str:
+        return super().format(record).encode(self._encoding, 'ignore').decode(self._encoding)
+
+
+# Configure logging with rotation to prevent log files from growing too large.
+# Streamlit re-executes this script on every interaction, so only configure once
+# per process. Records go through a queue; a listener thread does the file and
+# console I/O so worker threads never block on log writes.
+if not logging.getLogger().handlers:
+    _log_format = '%(asctime)s - %(levelname)s - %(message)s'
+    _file_handler = RotatingFileHandler(
+        'app.log',
+        maxBytes=10*1024*1024,  # 10MB max file size
+        backupCount=3,  # Keep 3 backup files
+        encoding='utf-8'
+    )
+    _file_handler.setFormatter(logging.Formatter(_log_format))
+    # Decide once whether the console can show emoji progress messages; if
+    # not, strip what it cannot encode instead of failing per record
+    _console_handler = logging.StreamHandler()
+    _console_encoding = getattr(_console_handler.stream, "encoding", None) or "utf-8"
+    if _console_encoding.lower().replace("-", "") in ("utf8", "utf16", "utf32"):
+        _console_handler.setFormatter(logging.Formatter(_log_format))
+    else:
+        _console_handler.setFormatter(_ConsoleSafeFormatter(_log_format, _console_encoding))
+    _log_targets = [_file_handler, _console_handler]
+    
+    _log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_listener = QueueListener(_log_queue, *_log_targets)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    _root_logger = logging.getLogger()
+    _root_logger.setLevel(logging.INFO)
+    _root_logger.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
 # -----------------------------
 # CONFIGURATION
 # -----------------------------
-@dataclass
+@dataclass(frozen=True)
 class Config:
-    """Application configuration with validation."""
+    """Application configuration with validation (read-only once created)."""
     audio_quality: int = field(default_factory=lambda: int(os.getenv("AUDIO_QUALITY", "96")))
     summary_max_tokens: int = 1000
     key_factors_max_tokens: int = 1500
@@ -133,8 +198,17 @@ class Config:
     openai_model: str = field(default_factory=lambda: os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
     rate_limit_seconds: int = 5
     max_audio_file_size_mb: int = 24
+    whisper_model_size: str = field(default_factory=lambda: os.getenv("WHISPER_MODEL", "small"))
+    whisper_device: str = field(default_factory=lambda: os.getenv("WHISPER_DEVICE", "auto"))  # auto = CUDA if present, else CPU
+    whisper_compute_type: str = field(default_factory=lambda: os.getenv("WHISPER_COMPUTE_TYPE", "auto"))  # auto = float16 where the GPU runs it natively, else int8
+    whisper_model_dir: Optional[str] = field(default_factory=lambda: os.getenv("WHISPER_MODEL_DIR") or None)  # None = Hugging Face cache
+    whisper_batch_size: int = field(default_factory=lambda: int(os.getenv("WHISPER_BATCH_SIZE", "8")))  # 1 = sequential decoding
+    whisper_vad_filter: bool = field(default_factory=lambda: os.getenv("WHISPER_VAD_FILTER", "true").lower() == "true")  # Skip silence before decoding
+    whisper_beam_size: int = field(default_factory=lambda: int(os.getenv("WHISPER_BEAM_SIZE", "1")))  # 1 = greedy; set 5 for highest accuracy
     audio_chunk_size_mb: int = 20  # Target size for audio chunks when splitting
     audio_chunk_overlap_ms: int = 500  # Overlap between chunks to prevent word cuts
+    transcription_max_workers: int = field(default_factory=lambda: int(os.getenv("TRANSCRIPTION_MAX_WORKERS", "4")))  # Concurrent Whisper API uploads
+    whisper_requests_per_minute: int = field(default_factory=lambda: int(os.getenv("WHISPER_RPM", "50")))  # Client-side cap on Whisper API calls
     max_document_upload_mb: int = 50  # Maximum document upload size
     max_pdf_pages: int = 1000  # Maximum PDF pages to process
     max_pdf_page_chars: int = 200000  # Maximum characters per PDF page
@@ -143,7 +217,13 @@ class Config:
     output_dir: Path = None  # Will be set in __post_init__
     database_path: Path = None  # Will be set in __post_init__
     max_text_input_length: int = 100000  # Max characters for API calls
+    long_text_overlap_chars: int = 1000  # Overlap between windows when condensing over-long text
+    llm_max_workers: int = field(default_factory=lambda: int(os.getenv("LLM_MAX_WORKERS", "4")))  # Concurrent GPT calls when condensing
+    yt_title_cache_max_age_days: int = field(default_factory=lambda: int(os.getenv("YT_TITLE_CACHE_MAX_AGE_DAYS", "7")))  # Cached video titles older than this are refreshed in the background
+    batch_max_workers: int = field(default_factory=lambda: int(os.getenv("BATCH_MAX_WORKERS", "4")))  # Videos processed at once by process_youtube_batch
+    title_update_max_workers: int = field(default_factory=lambda: int(os.getenv("TITLE_UPDATE_MAX_WORKERS", "8")))  # Concurrent old-project title fetches
     api_timeout_seconds: int = 300  # 5 minutes
+    llm_cache_max_age_days: int = field(default_factory=lambda: int(os.getenv("LLM_CACHE_MAX_AGE_DAYS", "30")))  # Expiry for cached GPT responses and transcripts
     
     # Q&A Service Configuration
     qa_temperature: float = float(os.getenv("QA_TEMPERATURE", "0.7"))  # Creativity (0.0-2.0)
@@ -173,26 +253,54 @@ class Config:
                 "Missing required configuration: OPENAI_API_KEY must be set in your .env file before starting the app."
             )
         
-        # Set up paths based on data_root
+        # Set up paths based on data_root (frozen, so assign via object.__setattr__)
         if self.output_dir is None:
-            self.output_dir = self.data_root / "outputs"
+            object.__setattr__(self, "output_dir", self.data_root / "outputs")
         if self.database_path is None:
-            self.database_path = self.data_root / "youtube_analyzer.db"
+            object.__setattr__(self, "database_path", self.data_root / "youtube_analyzer.db")
         
         # Create directories
         self.data_root.mkdir(parents=True, exist_ok=True)
         self.output_dir.mkdir(exist_ok=True)
         
+        # Finish background deletes (see remove_tree_in_background) that were
+        # cut short by the process exiting: failed runs and chunk directories
+        for leftover in (*self.output_dir.glob(".*.deleting-*"), *self.output_dir.glob("*/.*.deleting-*")):
+            shutil.rmtree(leftover, ignore_errors=True)
+        
         logger.info(f"Configuration initialized: audio_quality={self.audio_quality}, model={self.openai_model}")
         logger.info(f"Data root: {self.data_root}")
         logger.info(f"Database: {self.database_path}")
 
 # Initialize configuration
-config = Config()
+@st.cache_resource
+def _load_config() -> Config:
+    """Build the configuration once per process instead of on every rerun."""
+    return Config()
+
+
+config = _load_config()
+
+# Upload limit in bytes so the size check is a plain integer comparison
+_MAX_UPLOAD_BYTES = int(config.max_document_upload_mb * 1024 * 1024)
 
 # Initialize database
 from database import DatabaseManager, ProjectNotFoundError
-db_manager = DatabaseManager(config.database_path)
+
+
+@st.cache_resource
+def _get_db_manager(database_path: Path) -> DatabaseManager:
+    """Open the database (and purge stale LLM/transcript cache entries) once per process."""
+    manager = DatabaseManager(database_path)
+    try:
+        manager.purge_llm_cache(config.llm_cache_max_age_days)
+        manager.purge_transcript_cache(config.llm_cache_max_age_days)
+    except Exception as e:
+        logger.warning(f"Failed to purge result caches: {e}")
+    return manager
+
+
+db_manager = _get_db_manager(config.database_path)
 
 # Prompt templates
 PROMPTS = {
@@ -225,19 +333,57 @@ PROMPTS = {
     5. People or Organizations Mentioned
     6. Actionable Takeaways
 
+    Transcript:
+    {text}
+    """,
+    "analyze": """
+    Analyze the following transcript and return a JSON object with exactly these keys:
+
+    "summary": a clear, well-structured, 4-6 paragraph narrative summary. Focus on
+    key ideas, themes, and progression of the speaker's argument.
+
+    "key_factors": key factors as formatted text with these sections:
+    1. Main Ideas
+    2. Notable Insights
+    3. Key Statistics or Facts
+    4. Important Quotes
+    5. People or Organizations Mentioned
+    6. Actionable Takeaways
+
+    "title": a clear, concise, and descriptive title (5-15 words) that captures
+    the main topic or theme.
+
     Transcript:
     {text}
     """
 }
 
 # Initialize OpenAI client with error handling
+@st.cache_resource
 def get_openai_client() -> OpenAI:
-    """Get or create OpenAI client with proper error handling."""
+    """Get or create OpenAI client with proper error handling (one per process)."""
     try:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
-        return OpenAI(api_key=api_key)
+        # Size the pool for every thread pool that can call the API at once
+        # (Whisper uploads, condensing windows, background title updates) so
+        # parallel calls never queue for a connection. Keep idle connections
+        # for a minute (httpx default: 5s) so the GPT calls after a long
+        # transcription reuse the TLS session instead of redialling.
+        concurrent_calls = (
+            config.transcription_max_workers +
+            config.llm_max_workers +
+            config.title_update_max_workers
+        )
+        http_client = DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=concurrent_calls + 4,
+                max_keepalive_connections=concurrent_calls,
+                keepalive_expiry=60.0
+            )
+        )
+        return OpenAI(api_key=api_key, http_client=http_client)
     except Exception as e:
         logger.error(f"Failed to initialize OpenAI client: {e}")
         raise ValueError(
@@ -277,11 +423,16 @@ def sanitize_url_for_log(url: str, max_length: int = 50) -> str:
 
 def safe_filename(s: str) -> str:
     """Convert string to safe filename by replacing invalid chars with underscores."""
+    # Fast path: already safe, nothing to rewrite
+    if _SAFE_FILENAME_RE.fullmatch(s):
+        return s
+
     result_chars = []
     punctuation_sequence = False
 
     for ch in s:
-        if re.match(r"[a-zA-Z0-9_\-]", ch):
+        # Set lookup per character instead of a regex call per character
+        if ch in _SAFE_FILENAME_CHARS:
             result_chars.append(ch)
             punctuation_sequence = False
         elif ch.isspace():
@@ -302,6 +453,31 @@ def safe_filename(s: str) -> str:
     return "".join(result_chars)
 
 
+def derive_project_id(*parts: Any) -> str:
+    """
+    Derive a stable project directory name from the parts identifying a submission.
+    
+    Resubmitting the same source maps to the same directory, so completed work
+    can be reused instead of processed again.
+    
+    Args:
+        *parts: Identifying values (str or bytes), e.g. URL or filename and content
+        
+    Returns:
+        24-character hex string safe to use as a directory name
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        digest.update(b"\x1f")  # Separator so ("ab", "c") != ("a", "bc")
+    return digest.hexdigest()
+
+
+def _transcription_key(use_local_gpu: bool) -> str:
+    """Project ID part for the transcription method, so each method keeps its own results."""
+    return "local-gpu" if use_local_gpu else "openai-api"
+
+
 def validate_and_sanitize_path(path_component: str, base_dir: Path, allow_absolute: bool = False) -> Tuple[bool, Optional[Path], str]:
     """
     Validate and sanitize a path component to prevent directory traversal attacks.
@@ -328,17 +504,15 @@ def validate_and_sanitize_path(path_component: str, base_dir: Path, allow_absolu
     if not path_component.strip():
         return False, None, "Path component cannot be empty"
     
-    # Check for directory traversal patterns
-    traversal_patterns = ['..', '/', '\\']
-    for pattern in traversal_patterns:
-        if pattern in path_component:
-            logger.warning(f"Rejected path with traversal pattern '{pattern}': {sanitize_url_for_log(path_component)}")
-            return False, None, f"Path contains forbidden pattern: {pattern}"
-    
-    # Check for null bytes
-    if '\x00' in path_component:
-        logger.warning(f"Rejected path with null byte: {sanitize_url_for_log(path_component)}")
-        return False, None, "Path contains null byte"
+    # Check for directory traversal patterns and null bytes in a single scan
+    forbidden = _FORBIDDEN_PATH_RE.search(path_component)
+    if forbidden:
+        pattern = forbidden.group()
+        if pattern == '\x00':
+            logger.warning(f"Rejected path with null byte: {sanitize_url_for_log(path_component)}")
+            return False, None, "Path contains null byte"
+        logger.warning(f"Rejected path with traversal pattern '{pattern}': {sanitize_url_for_log(path_component)}")
+        return False, None, f"Path contains forbidden pattern: {pattern}"
     
     # Reject absolute paths if not allowed
     if not allow_absolute:
@@ -421,8 +595,8 @@ def validate_youtube_url(url: str) -> bool:
             logger.warning(f"Rejected non-HTTP(S) protocol: {sanitize_url_for_log(url)}")
             return False
         
-        # Extract and validate video ID
-        video_id = extract_video_id(url)
+        # Extract and validate video ID (reusing the parse above)
+        video_id = _video_id_from_parsed(parsed)
         
         # Video ID must be present and valid format
         if not video_id:
@@ -431,7 +605,7 @@ def validate_youtube_url(url: str) -> bool:
         
         # YouTube video IDs are exactly 11 alphanumeric characters
         # Allow hyphens and underscores for edge cases
-        if len(video_id) != 11 or not all(c.isalnum() or c in ('-', '_') for c in video_id):
+        if not _VIDEO_ID_RE.fullmatch(video_id):
             logger.warning(f"Invalid video ID format: {sanitize_url_for_log(video_id)}")
             return False
         
@@ -471,6 +645,28 @@ def read_file_bytes(path: Path) -> bytes:
         raise
 
 
+def read_text_prefix(path: Path, max_chars: int) -> str:
+    """
+    Read only the first `max_chars` characters of a UTF-8 text file.
+    
+    Reads at most 4 bytes per character in one binary read instead of going
+    through the text-mode decoder stack; a character cut at the end is dropped.
+    
+    Args:
+        path: Path to a UTF-8 text file
+        max_chars: Number of characters wanted
+        
+    Returns:
+        Up to `max_chars` characters from the start of the file
+        
+    Raises:
+        IOError: If file cannot be read
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(max_chars * 4)
+    return prefix.decode("utf-8", errors="ignore")[:max_chars]
+
+
 def safe_write_text(path: Path, content: str, encoding: str = "utf-8") -> bool:
     """
     Safely write text to file with error handling.
@@ -495,6 +691,84 @@ def safe_write_text(path: Path, content: str, encoding: str = "utf-8") -> bool:
         return False
 
 
+def safe_write_bytes(path: Path, content: bytes) -> bool:
+    """
+    Safely write bytes to file with error handling.
+    
+    Args:
+        path: Path where file should be written
+        content: Bytes to write (e.g. already-encoded JSON)
+        
+    Returns:
+        True if write succeeded, False otherwise
+    """
+    try:
+        path.write_bytes(content)
+        logger.debug(f"Successfully wrote to {path}")
+        return True
+    except (IOError, OSError) as e:
+        logger.error(f"Failed to write to {path}: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Unexpected error writing to {path}: {e}")
+        return False
+
+
+def write_output_files(outputs: List[Tuple[str, Path, Union[str, bytes]]]) -> None:
+    """
+    Write several output files concurrently.
+    
+    File writes release the GIL, so on slow or networked volumes they overlap
+    instead of queuing behind each other.
+    
+    Args:
+        outputs: (description, path, content) triples; bytes are written as-is,
+            text as UTF-8
+        
+    Raises:
+        IOError: If any file could not be written (names the first failure)
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(4, len(outputs)))) as executor:
+        futures = [
+            executor.submit(safe_write_bytes if isinstance(content, bytes) else safe_write_text, path, content)
+            for _, path, content in outputs
+        ]
+    for (description, _, _), future in zip(outputs, futures):
+        if not future.result():
+            raise IOError(f"Failed to save {description} file")
+
+
+def remove_tree_in_background(path: Path) -> None:
+    """
+    Delete a directory tree without blocking the caller.
+    
+    The directory is first renamed to a unique hidden sibling (a single,
+    fast rename), so a new run can recreate the same path immediately; the
+    slow recursive delete then happens on a daemon thread. Leftovers from a
+    delete cut short by process exit are swept when the config loads.
+    
+    If the rename fails (e.g. a file inside is still open on Windows), the
+    tree is deleted in place instead, removing whatever can be removed.
+    
+    Args:
+        path: Directory to remove
+    """
+    doomed = path.with_name(f".{path.name}.deleting-{time.time_ns()}")
+    try:
+        path.rename(doomed)
+    except OSError as e:
+        logger.warning(f"Could not rename {path} for background delete, deleting in place: {e}")
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(doomed,),
+        kwargs={"ignore_errors": True},
+        name=f"rmtree-{path.name}",
+        daemon=True
+    ).start()
+
+
 T = TypeVar("T")
 
 
@@ -538,6 +812,35 @@ def _run_with_backoff(
             delay *= backoff_factor
 
 
+class RateLimiter:
+    """
+    Thread-safe sliding-window limiter for outbound API requests.
+    
+    Callers block in acquire() until the window has room, so concurrent
+    workers stay under the provider's requests-per-minute limit instead of
+    discovering it through 429 responses.
+    """
+    
+    def __init__(self, max_requests: int, period_seconds: float = 60.0):
+        self.max_requests = max(1, max_requests)
+        self.period_seconds = period_seconds
+        self._request_times: Deque[float] = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a request slot is free, then claim it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._request_times and now - self._request_times[0] >= self.period_seconds:
+                    self._request_times.popleft()
+                if len(self._request_times) < self.max_requests:
+                    self._request_times.append(now)
+                    return
+                wait = self.period_seconds - (now - self._request_times[0])
+            time.sleep(wait)
+
+
 # Q&A functionality moved to qa_service.py for better modularity
 # Import it here for backward compatibility
 from qa_service import answer_question_from_transcript as _qa_function
@@ -565,19 +868,11 @@ def sanitize_chat_question(question: str) -> str:
     
     # Remove HTML/XML tags (basic XSS prevention)
     # This regex removes <...> tags but preserves content
-    question = re.sub(r'<[^>]+>', '', question)
+    question = _HTML_TAG_RE.sub('', question)
     
     # Remove script-related patterns (case-insensitive)
-    script_patterns = [
-        r'javascript:',
-        r'on\w+\s*=',  # Event handlers like onclick=, onerror=
-        r'<script',
-        r'</script>',
-        r'eval\s*\(',
-        r'expression\s*\(',
-    ]
-    for pattern in script_patterns:
-        question = re.sub(pattern, '', question, flags=re.IGNORECASE)
+    for pattern in _SCRIPT_PATTERN_RES:
+        question = pattern.sub('', question)
     
     # Remove control characters except newline (\n), tab (\t), and carriage return (\r)
     # Control characters are in range 0x00-0x1F except 0x09 (tab), 0x0A (newline), 0x0D (carriage return)
@@ -600,8 +895,8 @@ def sanitize_chat_question(question: str) -> str:
     
     # Clean up excessive whitespace (multiple spaces, newlines)
     # Preserve tabs and single newlines, but clean up excessive spaces
-    question = re.sub(r' +', ' ', question)  # Multiple spaces -> single space
-    question = re.sub(r'\n{3,}', '\n\n', question)  # More than 2 newlines -> 2 newlines
+    question = _MULTI_SPACE_RE.sub(' ', question)  # Multiple spaces -> single space
+    question = _EXCESS_NEWLINES_RE.sub('\n\n', question)  # More than 2 newlines -> 2 newlines
     question = question.strip()
     
     return question
@@ -638,6 +933,37 @@ def check_chat_rate_limit(project_key: str, min_seconds: int = 2) -> Tuple[bool,
     return True, None
 
 
+def _set_session_flag(key: str, value: bool) -> None:
+    """Widget callback that sets a session-state flag before the triggered rerun."""
+    st.session_state[key] = value
+
+
+def _set_pending_delete(project_dir: str, pending: bool) -> None:
+    """Widget callback that marks or clears a project as awaiting delete confirmation."""
+    pending_delete = st.session_state.setdefault('pending_delete', set())
+    if pending:
+        pending_delete.add(project_dir)
+    else:
+        pending_delete.discard(project_dir)
+
+
+def _enforce_rate_limit() -> None:
+    """
+    Stop the current run if a processing request was started too recently.
+    
+    Shared by video and document processing; records the start time when allowed.
+    """
+    st.session_state.setdefault('last_process_time', 0.0)
+    current_time = time.time()
+    time_since_last = current_time - st.session_state['last_process_time']
+    if time_since_last < config.rate_limit_seconds:
+        wait_time = config.rate_limit_seconds - time_since_last
+        st.warning(f"⏳ Please wait {wait_time:.1f} more seconds before processing another request.")
+        st.stop()
+    
+    st.session_state['last_process_time'] = current_time
+
+
 def answer_question_from_transcript(question: str, transcript: str, title: str, 
                                     summary: str = "") -> str:
     """
@@ -686,6 +1012,32 @@ def truncate_title(title: str, max_length: Optional[int] = None) -> str:
     return title
 
 
+def _video_id_from_parsed(parsed: Any) -> str:
+    """
+    Pull the video ID out of an already-parsed YouTube URL.
+    
+    Args:
+        parsed: Result of urlparse() on the URL
+        
+    Returns:
+        Video ID string, or empty string if none is present
+    """
+    if 'youtube.com' in parsed.netloc:
+        # Handle /shorts/ URLs
+        if '/shorts/' in parsed.path:
+            return parsed.path.split('/shorts/')[1].split('/')[0]
+        # Handle ?v= parameter: first non-blank value, decoded, like parse_qs
+        if parsed.query:
+            match = _VIDEO_ID_PARAM_RE.search(parsed.query)
+            return unquote_plus(match.group(1)) if match else ""
+    
+    # Handle youtu.be URLs
+    elif 'youtu.be' in parsed.netloc:
+        return parsed.path.lstrip('/')
+    
+    return ""
+
+
 def extract_video_id(url: str) -> str:
     """
     Extract YouTube video ID from various URL formats.
@@ -697,23 +1049,8 @@ def extract_video_id(url: str) -> str:
         Video ID string, or empty string if extraction fails
     """
     try:
-        parsed = urlparse(url)
-        
-        if 'youtube.com' in parsed.netloc:
-            # Handle /shorts/ URLs
-            if '/shorts/' in parsed.path:
-                return parsed.path.split('/shorts/')[1].split('/')[0]
-            # Handle ?v= parameter
-            elif parsed.query:
-                params = parse_qs(parsed.query)
-                return params.get('v', [''])[0]
-        
-        # Handle youtu.be URLs
-        elif 'youtu.be' in parsed.netloc:
-            return parsed.path.lstrip('/')
-        
-        return ""
-    except (ValueError, IndexError, KeyError) as e:
+        return _video_id_from_parsed(urlparse(url))
+    except ValueError as e:
         logger.warning(f"Failed to extract video ID from {sanitize_url_for_log(url)}: {e}")
         return ""
 
@@ -738,20 +1075,21 @@ def format_url_for_display(url: str, max_length: Optional[int] = None) -> str:
     return url
 
 
-def format_timestamp(seconds: float) -> str:
+def format_timestamp(seconds: float, decimal_separator: str = ".") -> str:
     """
     Convert seconds into HH:MM:SS.mmm format.
     
     Args:
         seconds: Time in seconds
+        decimal_separator: Character between seconds and milliseconds ("," for SRT)
         
     Returns:
         Formatted timestamp string
     """
-    hrs = int(seconds // 3600)
-    mins = int((seconds % 3600) // 60)
-    secs = seconds % 60
-    return f"{hrs:02d}:{mins:02d}:{secs:06.3f}"
+    hrs, rem_ms = divmod(int(round(seconds * 1000)), 3600000)
+    mins, rem_ms = divmod(rem_ms, 60000)
+    secs, millis = divmod(rem_ms, 1000)
+    return f"{hrs:02d}:{mins:02d}:{secs:02d}{decimal_separator}{millis:03d}"
 
 
 def to_srt(segments: List[Dict[str, Any]]) -> str:
@@ -764,13 +1102,56 @@ def to_srt(segments: List[Dict[str, Any]]) -> str:
     Returns:
         SRT formatted string
     """
-    srt_lines = []
-    for i, seg in enumerate(segments, start=1):
-        start = format_timestamp(seg["start"]).replace('.', ',')
-        end = format_timestamp(seg["end"]).replace('.', ',')
-        text = seg["text"].strip()
-        srt_lines.append(f"{i}\n{start} --> {end}\n{text}\n")
-    return "\n".join(srt_lines)
+    return "\n".join(
+        f"{i}\n{format_timestamp(seg['start'], ',')} --> {format_timestamp(seg['end'], ',')}\n"
+        f"{seg['text'].strip()}\n"
+        for i, seg in enumerate(segments, start=1)
+    )
+
+
+def write_transcript_files(
+    segments: List[Dict[str, Any]],
+    timestamped_path: Path,
+    srt_path: Path
+) -> str:
+    """
+    Write the timestamped transcript and SRT file in a single pass over segments.
+    
+    SRT entries are streamed to disk as each segment is formatted, and the
+    timestamped transcript is joined once from a generator rather than built
+    up as a list of lines. Each timestamp is formatted once for both files.
+    Output matches to_srt().
+    
+    Args:
+        segments: List of segment dictionaries with 'start', 'end', and 'text' keys
+        timestamped_path: Destination for the "[start → end]" transcript
+        srt_path: Destination for the SRT subtitles
+        
+    Returns:
+        Timestamped transcript text (for display)
+        
+    Raises:
+        OSError: If either file cannot be written
+    """
+    with open(srt_path, "w", encoding="utf-8") as srt_file:
+        def timestamped_entries():
+            prev_end_seconds, end = None, ""
+            for i, seg in enumerate(segments, start=1):
+                # Whisper segments are usually contiguous, so a segment's start is
+                # the previous segment's end and its formatted string can be reused
+                start = end if seg["start"] == prev_end_seconds else format_timestamp(seg["start"])
+                prev_end_seconds = seg["end"]
+                end = format_timestamp(prev_end_seconds)
+                text = seg["text"].strip()
+                separator = "\n" if i > 1 else ""
+                # SRT only differs in the decimal separator of the timestamps
+                srt_file.write(f"{separator}{i}\n{start.replace('.', ',')} --> {end.replace('.', ',')}\n{text}\n")
+                yield f"[{start} → {end}]\n{text}\n"
+        
+        timestamped_text = "\n".join(timestamped_entries())
+    
+    timestamped_path.write_text(timestamped_text, encoding="utf-8")
+    return timestamped_text
 
 
 # -----------------------------
@@ -789,35 +1170,48 @@ def extract_text_from_pdf(file_bytes: bytes) -> str:
     Raises:
         DocumentProcessingError: If PDF exceeds limits or cannot be parsed
     """
+    import pypdfium2 as pdfium
+    
     try:
-        pdf_file = io.BytesIO(file_bytes)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        
-        # Security: Limit number of pages to prevent DoS
-        num_pages = len(pdf_reader.pages)
-        if num_pages > config.max_pdf_pages:
-            raise DocumentProcessingError(
-                f"PDF too large: {num_pages} pages (maximum: {config.max_pdf_pages} pages). "
-                f"Please split the document or process fewer pages."
-            )
+        # PDFium parses in native code; pages are closed as soon as they are read
+        pdf = pdfium.PdfDocument(file_bytes)
         
-        logger.info(f"Processing PDF with {num_pages} pages")
-        
-        text = []
-        for i, page in enumerate(pdf_reader.pages):
-            try:
-                page_text = page.extract_text()
-                
-                # Security: Limit text per page to prevent memory exhaustion
-                if page_text and len(page_text) > config.max_pdf_page_chars:
-                    logger.warning(f"Page {i+1} text truncated (too large)")
-                    page_text = page_text[:config.max_pdf_page_chars]
-                
-                if page_text:
-                    text.append(page_text)
-            except Exception as e:
-                logger.warning(f"Failed to extract text from page {i+1}: {e}")
-                continue
+        try:
+            # Security: Limit number of pages to prevent DoS
+            num_pages = len(pdf)
+            if num_pages > config.max_pdf_pages:
+                raise DocumentProcessingError(
+                    f"PDF too large: {num_pages} pages (maximum: {config.max_pdf_pages} pages). "
+                    f"Please split the document or process fewer pages."
+                )
+            
+            logger.info(f"Processing PDF with {num_pages} pages")
+            
+            text = []
+            for i in range(num_pages):
+                try:
+                    page = pdf[i]
+                    try:
+                        textpage = page.get_textpage()
+                        try:
+                            page_text = textpage.get_text_range()
+                        finally:
+                            textpage.close()
+                    finally:
+                        page.close()
+                    
+                    # Security: Limit text per page to prevent memory exhaustion
+                    if page_text and len(page_text) > config.max_pdf_page_chars:
+                        logger.warning(f"Page {i+1} text truncated (too large)")
+                        page_text = page_text[:config.max_pdf_page_chars]
+                    
+                    if page_text:
+                        text.append(page_text)
+                except Exception as e:
+                    logger.warning(f"Failed to extract text from page {i+1}: {e}")
+                    continue
+        finally:
+            pdf.close()
         
         if not text:
             raise DocumentProcessingError("No text could be extracted from PDF")
@@ -843,12 +1237,11 @@ def extract_text_from_docx(file_bytes: bytes) -> str:
     Raises:
         Exception: If DOCX cannot be read or parsed
     """
+    import docx
+    
     docx_file = io.BytesIO(file_bytes)
     doc = docx.Document(docx_file)
-    text = []
-    for paragraph in doc.paragraphs:
-        text.append(paragraph.text)
-    return "\n\n".join(text)
+    return "\n\n".join(paragraph.text for paragraph in doc.paragraphs)
 
 
 def extract_text_from_txt(file_bytes: bytes) -> str:
@@ -864,25 +1257,38 @@ def extract_text_from_txt(file_bytes: bytes) -> str:
     Raises:
         UnicodeDecodeError: If file cannot be decoded
     """
-    
-    # Detect encoding for better compatibility
-    detected = chardet.detect(file_bytes)
-    encoding = detected.get('encoding', 'utf-8')
-    confidence = detected.get('confidence', 0)
-    
-    logger.info(f"Detected text encoding: {encoding} (confidence: {confidence:.2%})")
-    
+    # Most uploads are UTF-8; a strict decode settles that without detection
     try:
-        # Try detected encoding first
+        return file_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    
+    import charset_normalizer
+    
+    # Detect from a leading sample first; scanning multi-MB uploads rarely adds
+    # anything. The sample ends on a line break so it does not stop in the
+    # middle of a multibyte character. If the sample is inconclusive or its
+    # encoding does not decode the whole file, detect on the whole file.
+    samples = [file_bytes]
+    if len(file_bytes) > _ENCODING_SAMPLE_BYTES:
+        sample = file_bytes[:_ENCODING_SAMPLE_BYTES]
+        line_end = sample.rfind(b"\n")
+        samples.insert(0, sample[:line_end + 1] if line_end > 0 else sample)
+    
+    for sample in samples:
+        detected = charset_normalizer.detect(sample)
+        encoding = detected.get('encoding')
+        confidence = detected.get('confidence') or 0
+        logger.info(f"Detected text encoding: {encoding} (confidence: {confidence:.2%})")
         if encoding and confidence > 0.7:
-            return file_bytes.decode(encoding)
-        else:
-            # Fallback to UTF-8
-            return file_bytes.decode('utf-8')
-    except (UnicodeDecodeError, LookupError):
-        # Last resort: UTF-8 with error replacement
-        logger.warning(f"Encoding detection failed, using UTF-8 with error replacement")
-        return file_bytes.decode('utf-8', errors='replace')
+            try:
+                return file_bytes.decode(encoding)
+            except (UnicodeDecodeError, LookupError):
+                pass
+    
+    # Last resort: UTF-8 with error replacement
+    logger.warning(f"Encoding detection failed, using UTF-8 with error replacement")
+    return file_bytes.decode('utf-8', errors='replace')
 
 
 # File signature (magic bytes) for supported formats
@@ -893,7 +1299,31 @@ FILE_SIGNATURES = {
 }
 
 
-def validate_uploaded_file(uploaded_file: Any) -> Tuple[bool, str]:
+def _read_upload_bytes(uploaded_file: Any) -> bytes:
+    """
+    Return an upload's full content without moving its read position.
+    
+    Streamlit uploads are in-memory buffers whose getvalue() hands back the
+    existing bytes object, so this avoids the copy a read() would make.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object (or any file-like object)
+        
+    Returns:
+        File content as bytes
+    """
+    if hasattr(uploaded_file, 'getvalue'):
+        return uploaded_file.getvalue()
+    
+    # Plain file objects: read everything, then restore the position for later processing
+    current_pos = uploaded_file.tell() if hasattr(uploaded_file, 'tell') else 0
+    file_bytes = uploaded_file.read()
+    if hasattr(uploaded_file, 'seek'):
+        uploaded_file.seek(current_pos)
+    return file_bytes
+
+
+def validate_uploaded_file(uploaded_file: Any, file_bytes: Optional[bytes] = None) -> Tuple[bool, str]:
     """
     Validate uploaded file with security checks.
     
@@ -905,6 +1335,7 @@ def validate_uploaded_file(uploaded_file: Any) -> Tuple[bool, str]:
     
     Args:
         uploaded_file: Streamlit uploaded file object
+        file_bytes: Upload content if already read (avoids reading the file again)
         
     Returns:
         Tuple of (is_valid: bool, error_message: str)
@@ -943,17 +1374,13 @@ def validate_uploaded_file(uploaded_file: Any) -> Tuple[bool, str]:
     if not file_ext:
         return False, f"Unsupported file type. Please use PDF, DOCX, or TXT files."
     
-    # Read file bytes for signature verification
-    try:
-        # Save current position
-        current_pos = uploaded_file.tell() if hasattr(uploaded_file, 'tell') else 0
-        file_bytes = uploaded_file.read()
-        # Reset position for later processing
-        if hasattr(uploaded_file, 'seek'):
-            uploaded_file.seek(current_pos)
-    except Exception as e:
-        logger.error(f"Failed to read file for validation: {e}")
-        return False, "Unable to read file for validation"
+    # Read file bytes for signature verification (unless the caller already has them)
+    if file_bytes is None:
+        try:
+            file_bytes = _read_upload_bytes(uploaded_file)
+        except Exception as e:
+            logger.error(f"Failed to read file for validation: {e}")
+            return False, "Unable to read file for validation"
     
     # Check for empty file first
     if len(file_bytes) == 0:
@@ -1009,8 +1436,30 @@ def extract_text_from_document(uploaded_file: Any) -> str:
         DocumentProcessingError: If file format is not supported or extraction fails
     """
     try:
-        file_bytes = uploaded_file.read()
-        file_name = uploaded_file.name.lower()
+        file_bytes = _read_upload_bytes(uploaded_file)
+    except Exception as e:
+        raise DocumentProcessingError(
+            f"Failed to extract text from document: {str(e)}"
+        ) from e
+    return extract_text_from_bytes(file_bytes, uploaded_file.name)
+
+
+def extract_text_from_bytes(file_bytes: bytes, filename: str) -> str:
+    """
+    Extract text from document content that has already been read into memory.
+    
+    Args:
+        file_bytes: Document content as bytes
+        filename: Original filename (used to pick the format by extension)
+        
+    Returns:
+        Extracted text content
+        
+    Raises:
+        DocumentProcessingError: If file format is not supported or extraction fails
+    """
+    try:
+        file_name = filename.lower()
         
         if file_name.endswith('.pdf'):
             text = extract_text_from_pdf(file_bytes)
@@ -1044,13 +1493,35 @@ def extract_text_from_document(uploaded_file: Any) -> str:
 # -----------------------------
 # YOUTUBE DOWNLOADER
 # -----------------------------
-def download_audio(url: str, session_dir: Path) -> Tuple[Path, Dict[str, Any]]:
+def _fit_audio_bitrate_kbps(duration_seconds: Optional[float]) -> int:
+    """
+    Pick an MP3 bitrate at which the whole video fits in one Whisper API upload.
+    
+    Never exceeds the configured AUDIO_QUALITY and never drops below 32 kbps;
+    videos too long even at 32 kbps are still split into chunks later.
+    
+    Args:
+        duration_seconds: Video duration reported by yt-dlp, if known
+        
+    Returns:
+        Bitrate in kbps
+    """
+    if not duration_seconds or duration_seconds <= 0:
+        return config.audio_quality
+    # 5% headroom for MP3 framing and tags
+    budget_kbits = config.max_audio_file_size_mb * 1024 * 1024 * 8 / 1000 * 0.95
+    return max(32, min(config.audio_quality, int(budget_kbits / duration_seconds)))
+
+
+def download_audio(url: str, session_dir: Path, fit_api_upload: bool = False) -> Tuple[Path, Dict[str, Any]]:
     """
     Download audio from YouTube video.
     
     Args:
         url: YouTube video URL
         session_dir: Directory to save audio file
+        fit_api_upload: If True, lower the bitrate (and downmix to mono) so the
+            audio fits in a single Whisper API upload where possible
         
     Returns:
         Tuple of (audio_path, video_info_dict)
@@ -1074,9 +1545,28 @@ def download_audio(url: str, session_dir: Path) -> Tuple[Path, Dict[str, Any]]:
         'no_warnings': True,
     }
 
+    import yt_dlp
+
     def _download_attempt():
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            return ydl.extract_info(url, download=True)
+        if not fit_api_upload:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                return ydl.extract_info(url, download=True)
+        
+        # Read the duration first so the bitrate is chosen before anything is
+        # downloaded, then download from the same info dict (no second lookup)
+        with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as probe:
+            info = probe.extract_info(url, download=False)
+        bitrate_kbps = _fit_audio_bitrate_kbps(info.get('duration'))
+        if bitrate_kbps < config.audio_quality:
+            logger.info(f"Encoding audio at {bitrate_kbps} kbps mono to fit one Whisper upload")
+        fitted_opts = {
+            **ydl_opts,
+            'postprocessors': [{**ydl_opts['postprocessors'][0], 'preferredquality': str(bitrate_kbps)}],
+            # Whisper downmixes to mono anyway; mono keeps quality up at low bitrates
+            'postprocessor_args': {'extractaudio': ['-ac', '1']},
+        }
+        with yt_dlp.YoutubeDL(fitted_opts) as ydl:
+            return ydl.process_ie_result(info, download=True)
 
     try:
         info = _run_with_backoff(
@@ -1121,13 +1611,38 @@ def download_audio(url: str, session_dir: Path) -> Tuple[Path, Dict[str, Any]]:
 # -----------------------------
 # AUDIO CHUNKING FOR LARGE FILES
 # -----------------------------
+def _probe_audio_duration_seconds(audio_path: Path) -> float:
+    """
+    Read an audio file's duration from its container header with ffprobe.
+    
+    Args:
+        audio_path: Path to audio file
+        
+    Returns:
+        Duration in seconds
+        
+    Raises:
+        subprocess.CalledProcessError: If ffprobe cannot read the file
+        ValueError: If ffprobe reports no duration
+    """
+    completed = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(audio_path)
+        ],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    return float(completed.stdout.strip())
+
+
 def split_audio_file(audio_path: Path) -> List[Path]:
     """
     Split audio file into smaller chunks if it exceeds size limit.
     
-    Uses pydub to intelligently split large audio files into chunks that meet
-    Whisper API's size requirements, with overlap to prevent mid-word cuts.
-    
     Args:
         audio_path: Path to audio file
         
@@ -1137,19 +1652,46 @@ def split_audio_file(audio_path: Path) -> List[Path]:
     Raises:
         AudioDownloadError: If audio splitting fails
     """
-    file_size_mb = audio_path.stat().st_size / (1024 * 1024)
+    return [chunk_path for chunk_path, _ in split_audio_into_chunks(audio_path)]
+
+
+def split_audio_into_chunks(
+    audio_path: Path,
+    on_chunk: Optional[Callable[[Path, float], None]] = None
+) -> List[Tuple[Path, float]]:
+    """
+    Split audio file into chunks, returning each chunk with its start time.
+    
+    Uses ffmpeg stream copy to cut large audio files into chunks that meet
+    Whisper API's size requirements, with overlap to prevent mid-word cuts.
+    MP3 frames are copied as-is, so nothing is decoded or re-encoded. The
+    splitter already knows where every chunk starts, so callers can place
+    chunk timestamps on the source timeline without probing the chunks.
+    
+    Args:
+        audio_path: Path to audio file
+        on_chunk: Optional callback(chunk path, start offset in seconds) run as
+            soon as each chunk file is written (not called when no split is needed)
+        
+    Returns:
+        List of (chunk path, start offset in seconds) tuples
+        (single (audio_path, 0.0) item if no split needed)
+        
+    Raises:
+        AudioDownloadError: If audio splitting fails
+    """
+    file_size_mb = audio_path.stat().st_size / (1024 * 1024)
     
     # If file is small enough, return as-is
     if file_size_mb <= config.max_audio_file_size_mb:
         logger.info(f"Audio file size ({file_size_mb:.2f}MB) is within limit - no splitting needed")
-        return [audio_path]
+        return [(audio_path, 0.0)]
     
     logger.info(f"Audio file ({file_size_mb:.2f}MB) exceeds limit ({config.max_audio_file_size_mb}MB). Splitting into chunks...")
     
     try:
-        # Load audio file
-        audio = AudioSegment.from_mp3(audio_path)
-        total_duration_ms = len(audio)
+        # Read duration from the header instead of decoding the whole file
+        total_duration_ms = int(_probe_audio_duration_seconds(audio_path) * 1000)
         logger.info(f"Audio duration: {total_duration_ms / 1000:.2f} seconds")
         
         # Calculate chunk duration based on target size
@@ -1178,6 +1720,9 @@ def split_audio_file(audio_path: Path) -> List[Path]:
         start = 0
         chunk_num = 0
         max_chunks = 100  # Safety limit to prevent infinite loops
+        overlap_ms = config.audio_chunk_overlap_ms
+        source_path = str(audio_path)
+        log_chunk_sizes = logger.isEnabledFor(logging.DEBUG)
         
         while start < total_duration_ms and chunk_num < max_chunks:
             end = min(start + chunk_duration_ms, total_duration_ms)
@@ -1187,26 +1732,31 @@ def split_audio_file(audio_path: Path) -> List[Path]:
                 logger.error(f"Invalid chunk boundaries: start={start}, end={end}")
                 break
             
-            # Extract chunk
-            chunk = audio[start:end]
+            # Cut chunk by stream copy (keeps the source bitrate, no re-encode)
             chunk_path = chunk_dir / f"chunk_{chunk_num:03d}.mp3"
-            
-            # Export chunk with same quality settings
-            chunk.export(
-                chunk_path,
-                format="mp3",
-                bitrate=f"{config.audio_quality}k"
+            subprocess.run(
+                [
+                    "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+                    "-ss", f"{start / 1000:.3f}",
+                    "-t", f"{(end - start) / 1000:.3f}",
+                    "-i", source_path,
+                    "-c", "copy",
+                    str(chunk_path)
+                ],
+                check=True
             )
             
-            chunk_size_mb = chunk_path.stat().st_size / (1024 * 1024)
-            chunks.append(chunk_path)
+            chunks.append((chunk_path, start / 1000))
+            if on_chunk is not None:
+                on_chunk(chunk_path, start / 1000)
             
-            logger.info(f"Created chunk {chunk_num + 1}: {chunk_path.name} "
-                       f"({chunk_size_mb:.2f}MB, {(end-start)/1000:.1f}s)")
+            logger.info(f"Created chunk {chunk_num + 1}: {chunk_path.name} ({(end-start)/1000:.1f}s)")
+            if log_chunk_sizes:
+                logger.debug(f"{chunk_path.name} size: {chunk_path.stat().st_size / (1024 * 1024):.2f}MB")
             
             # Move to next chunk with overlap (prevents cutting mid-word)
             # Ensure overlap doesn't cause us to go backwards
-            new_start = end - config.audio_chunk_overlap_ms
+            new_start = end - overlap_ms
             if new_start <= start:
                 # If overlap would cause us to go backwards, just move forward slightly
                 new_start = start + (chunk_duration_ms // 2)
@@ -1228,7 +1778,23 @@ def split_audio_file(audio_path: Path) -> List[Path]:
 # -----------------------------
 # TRANSCRIPTION USING OPENAI
 # -----------------------------
-def _transcribe_single_file(audio_path: Path) -> Any:
+@dataclass
+class TranscriptionResult:
+    """Transcript text plus segments as plain {'start', 'end', 'text'} dicts."""
+    segments: List[Dict[str, Any]]
+    text: str
+
+
+@st.cache_resource
+def _get_whisper_rate_limiter(requests_per_minute: int) -> RateLimiter:
+    """Create the Whisper API limiter once per process, so every session and rerun shares one window."""
+    return RateLimiter(requests_per_minute)
+
+
+# Shared by every chunk worker so concurrent uploads respect the RPM limit
+_whisper_rate_limiter = _get_whisper_rate_limiter(config.whisper_requests_per_minute)
+
+def _transcribe_single_file(audio_path: Path) -> TranscriptionResult:
     """
     Helper function to transcribe a single audio file using OpenAI Whisper API.
     
@@ -1236,7 +1802,7 @@ def _transcribe_single_file(audio_path: Path) -> Any:
         audio_path: Path to audio file
         
     Returns:
-        Transcription result object with segments and text
+        TranscriptionResult with segments and text
         
     Raises:
         ValueError: If client is not initialized
@@ -1248,20 +1814,24 @@ def _transcribe_single_file(audio_path: Path) -> Any:
     if client is None:
         raise ValueError("OpenAI client is not initialized. Check OPENAI_API_KEY.")
     
-    logger.info(f"Transcribing {audio_path.name}, size: {audio_path.stat().st_size / (1024*1024):.2f} MB")
+    # Read the file once (uploads are capped at the Whisper size limit) so
+    # retries resend the same bytes instead of reopening and re-reading it
+    audio_bytes = audio_path.read_bytes()
+    logger.info(f"Transcribing {audio_path.name}, size: {len(audio_bytes) / (1024*1024):.2f} MB")
 
     def _whisper_api_call():
-        with open(audio_path, "rb") as audio_file:
-            return client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                response_format="verbose_json",
-                timestamp_granularities=["segment"],
-                timeout=config.api_timeout_seconds
-            )
+        _whisper_rate_limiter.acquire()
+        # Raw response: decode the JSON body ourselves instead of building SDK models
+        return client.audio.transcriptions.with_raw_response.create(
+            model="whisper-1",
+            file=(audio_path.name, audio_bytes),
+            response_format="verbose_json",
+            timestamp_granularities=["segment"],
+            timeout=config.api_timeout_seconds
+        )
 
     try:
-        result = _run_with_backoff(
+        raw_response = _run_with_backoff(
             "Whisper-1 transcription",
             _whisper_api_call,
             max_retries=3,
@@ -1270,7 +1840,14 @@ def _transcribe_single_file(audio_path: Path) -> Any:
             jitter=0.6,
             context=audio_path.name
         )
-        return result
+        payload = orjson.loads(raw_response.content)
+        return TranscriptionResult(
+            segments=[
+                {'start': seg['start'], 'end': seg['end'], 'text': seg['text']}
+                for seg in payload.get('segments') or ()
+            ],
+            text=payload.get('text', '')
+        )
     except Exception as e:
         error_str = str(e).lower()
         
@@ -1296,18 +1873,19 @@ def _transcribe_single_file(audio_path: Path) -> Any:
         ) from e
 
 
-def transcribe_audio_with_timestamps(audio_path: Path, progress_callback: Optional[callable] = None) -> Any:
+def transcribe_audio_with_timestamps(audio_path: Path, progress_callback: Optional[callable] = None) -> TranscriptionResult:
     """
     Transcribe audio file, automatically splitting if too large for Whisper API.
     
-    For large audio files, this function splits them into chunks, transcribes each
-    chunk separately, and merges the results with corrected timestamps.
+    For large audio files, this function splits them into chunks, starts uploading
+    each chunk as soon as it is cut, transcribes the chunks concurrently, and
+    merges the results in order with corrected timestamps.
     
     Args:
         audio_path: Path to audio file
         
     Returns:
-        Transcription result object with segments and text
+        TranscriptionResult with segments and text
         
     Raises:
         ValueError: If client is not initialized
@@ -1320,125 +1898,224 @@ def transcribe_audio_with_timestamps(audio_path: Path, progress_callback: Option
     if client is None:
         raise ValueError("OpenAI client is not initialized. Check OPENAI_API_KEY.")
     
-    # Split audio if needed
-    audio_chunks = split_audio_file(audio_path)
-    
-    if len(audio_chunks) == 1:
-        # Single file - transcribe normally
-        logger.info("Transcribing audio file (no splitting needed)")
-        return _transcribe_single_file(audio_chunks[0])
-    else:
-        # Multiple chunks - transcribe and merge
-        logger.info(f"Transcribing {len(audio_chunks)} audio chunks...")
-        
-        # Update progress callback if provided
-        if progress_callback:
-            progress_callback(30, f"🎤 Transcribing {len(audio_chunks)} audio chunks...")
+    # Chunks are independent uploads: each one is submitted as soon as ffmpeg
+    # has cut it, so uploads overlap with cutting the rest and with each other.
+    # Results arrive out of order and are merged in chunk order afterwards.
+    with ThreadPoolExecutor(max_workers=max(1, config.transcription_max_workers)) as executor:
+        futures: Dict[Any, int] = {}
         
-        all_segments = []
-        cumulative_time = 0.0
-        full_text_parts = []
+        def submit_chunk(chunk_path: Path, _offset: float) -> None:
+            futures[executor.submit(_transcribe_single_file, chunk_path)] = len(futures)
         
-        for i, chunk_path in enumerate(audio_chunks):
-            # Calculate progress (30-50% range for transcription)
-            chunk_progress = 30 + int((i / len(audio_chunks)) * 20)
-            progress_msg = f"🎤 Transcribing chunk {i+1}/{len(audio_chunks)}..."
-            
-            logger.info(progress_msg)
-            if progress_callback:
-                progress_callback(chunk_progress, progress_msg)
+        try:
+            # Split audio if needed
+            chunk_plan = split_audio_into_chunks(audio_path, on_chunk=submit_chunk)
             
-            # Transcribe this chunk
-            result = _transcribe_single_file(chunk_path)
+            if len(chunk_plan) == 1 and not futures:
+                # Single file - transcribe normally
+                logger.info("Transcribing audio file (no splitting needed)")
+                return _transcribe_single_file(chunk_plan[0][0])
             
-            # Adjust timestamps for this chunk based on cumulative time
-            if hasattr(result, 'segments'):
-                for segment in result.segments:
-                    # Create adjusted segment (handle both dict and object types)
-                    if isinstance(segment, dict):
-                        adjusted_segment = {
-                            'start': segment['start'] + cumulative_time,
-                            'end': segment['end'] + cumulative_time,
-                            'text': segment['text']
-                        }
-                    else:
-                        # segment is an object with attributes
-                        adjusted_segment = {
-                            'start': segment.start + cumulative_time,
-                            'end': segment.end + cumulative_time,
-                            'text': segment.text
-                        }
-                    all_segments.append(adjusted_segment)
+            # Multiple chunks - transcribe and merge
+            audio_chunks = [chunk_path for chunk_path, _ in chunk_plan]
+            for chunk_path in audio_chunks[len(futures):]:
+                submit_chunk(chunk_path, 0.0)
+            logger.info(f"Transcribing {len(audio_chunks)} audio chunks...")
             
-            # Collect text
-            if hasattr(result, 'text'):
-                full_text_parts.append(result.text)
+            # Update progress callback if provided
+            if progress_callback:
+                progress_callback(30, f"🎤 Transcribing {len(audio_chunks)} audio chunks...")
             
-            # Update cumulative time for next chunk
-            # Subtract overlap to account for the overlapping section
-            chunk_duration_s = AudioSegment.from_mp3(chunk_path).duration_seconds
-            cumulative_time += chunk_duration_s - (config.audio_chunk_overlap_ms / 1000.0)
-        
-        # Create combined result object
-        class CombinedTranscriptionResult:
-            """Combined transcription result from multiple chunks."""
-            def __init__(self, segments: List[Dict], text: str):
-                self.segments = segments
-                self.text = text
+            chunk_results: List[Any] = [None] * len(audio_chunks)
+            for completed, future in enumerate(as_completed(futures), start=1):
+                chunk_results[futures[future]] = future.result()
+                
+                # Calculate progress (30-50% range for transcription)
+                chunk_progress = 30 + int((completed / len(audio_chunks)) * 20)
+                progress_msg = f"🎤 Transcribed chunk {completed}/{len(audio_chunks)}..."
+                
+                logger.info(progress_msg)
+                if progress_callback:
+                    progress_callback(chunk_progress, progress_msg)
+        except Exception:
+            for pending in futures:
+                pending.cancel()
+            raise
+    
+    # Timeline offset of each chunk comes straight from the splitter
+    chunk_offsets = [offset for _, offset in chunk_plan]
+    
+    # Shift each chunk's segments onto the full-file timeline
+    all_segments = [
+        {'start': seg['start'] + offset, 'end': seg['end'] + offset, 'text': seg['text']}
+        for offset, result in zip(chunk_offsets, chunk_results)
+        for seg in result.segments
+    ]
+    combined_text = " ".join(result.text for result in chunk_results)
+    logger.info(f"Successfully merged {len(audio_chunks)} chunks into single transcript")
+    
+    if progress_callback:
+        progress_callback(50, f"✅ Merged {len(audio_chunks)} chunks successfully")
+    
+    # Cleanup chunk files
+    chunk_dir = audio_path.parent / "chunks"
+    if chunk_dir.exists():
+        try:
+            remove_tree_in_background(chunk_dir)
+            logger.info("Cleaned up temporary audio chunks")
+        except Exception as e:
+            logger.warning(f"Failed to cleanup chunks directory: {e}")
+    
+    return TranscriptionResult(all_segments, combined_text)
+
+
+# -----------------------------
+# LOCAL GPU TRANSCRIPTION
+# -----------------------------
+def _resolve_whisper_compute_type(device: str) -> str:
+    """
+    Pick the fastest CTranslate2 compute type for the target device.
+    
+    float16 is only a win on GPUs CTranslate2 reports native FP16 support
+    for; older cards (e.g. Pascal) and CPUs run int8 faster.
+    
+    Args:
+        device: "cuda", "cpu" or "auto" (CUDA if present, else CPU)
         
-        combined_text = " ".join(full_text_parts)
-        logger.info(f"Successfully merged {len(audio_chunks)} chunks into single transcript")
+    Returns:
+        "float16" or "int8"
+    """
+    import ctranslate2
+    
+    if device == "auto":
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if device == "cuda" and "float16" in ctranslate2.get_supported_compute_types("cuda"):
+        return "float16"
+    return "int8"
+
+
+@st.cache_resource(show_spinner=False)
+def _get_whisper_model(model_size: str, device: str, compute_type: str) -> "WhisperModel":
+    """
+    Return the process-wide faster-whisper model, loading it on first use.
+    
+    Cached as a Streamlit resource so the model survives script reruns and is
+    shared by every session; a module global would be reset on each rerun.
+    
+    Args:
+        model_size: Whisper model name (e.g. "small")
+        device: "cuda", "cpu" or "auto" (CUDA if present, else CPU)
+        compute_type: CTranslate2 compute type (e.g. "int8"), or "auto"
         
-        if progress_callback:
-            progress_callback(50, f"✅ Merged {len(audio_chunks)} chunks successfully")
+    Returns:
+        Loaded WhisperModel instance
+    """
+    from faster_whisper import WhisperModel
+    
+    if compute_type == "auto":
+        compute_type = _resolve_whisper_compute_type(device)
+    logger.info(f"Loading Whisper model '{model_size}' (device={device}, compute_type={compute_type})...")
+    model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        download_root=config.whisper_model_dir
+    )
+    logger.info("Whisper model loaded")
+    return model
+
+
+@st.cache_resource(show_spinner=False)
+def _start_whisper_prewarm(model_size: str, device: str, compute_type: str) -> threading.Thread:
+    """
+    Load the Whisper model in a background thread, once per process.
+    
+    Started as soon as the user picks local transcription so the model is
+    usually resident by the time they press Process. A transcription that
+    starts earlier simply waits on the same cached load.
+    
+    Args:
+        model_size: Whisper model name (e.g. "small")
+        device: "cuda", "cpu" or "auto"
+        compute_type: CTranslate2 compute type, or "auto"
         
-        # Cleanup chunk files
-        chunk_dir = audio_path.parent / "chunks"
-        if chunk_dir.exists():
-            try:
-                shutil.rmtree(chunk_dir)
-                logger.info("Cleaned up temporary audio chunks")
-            except Exception as e:
-                logger.warning(f"Failed to cleanup chunks directory: {e}")
+    Returns:
+        The (daemon) prewarm thread
+    """
+    def prewarm() -> None:
+        try:
+            _get_whisper_model(model_size, device, compute_type)
+        except Exception as e:
+            logger.warning(f"Whisper model prewarm failed: {e}")
+    
+    thread = threading.Thread(target=prewarm, name="whisper-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+@st.cache_resource(show_spinner=False)
+def _get_batched_whisper_pipeline(model_size: str, device: str, compute_type: str) -> Any:
+    """
+    Wrap the cached Whisper model in a BatchedInferencePipeline.
+    
+    The pipeline splits audio on voice activity and decodes several windows
+    per GPU call instead of one at a time.
+    
+    Args:
+        model_size: Whisper model name (e.g. "small")
+        device: "cuda", "cpu" or "auto"
+        compute_type: CTranslate2 compute type
         
-        return CombinedTranscriptionResult(all_segments, combined_text)
+    Returns:
+        BatchedInferencePipeline sharing the cached model
+    """
+    from faster_whisper import BatchedInferencePipeline
+    
+    return BatchedInferencePipeline(model=_get_whisper_model(model_size, device, compute_type))
 
 
-# -----------------------------
-# LOCAL GPU TRANSCRIPTION
-# -----------------------------
-# Global variable to cache the loaded model
-_gpu_model_cache = None
+def release_whisper_model() -> None:
+    """
+    Drop the cached Whisper model so its GPU memory can be reclaimed.
+    
+    CTranslate2 frees VRAM when the model object is garbage collected. A
+    transcription already running elsewhere keeps its own reference, so the
+    memory is released once that run finishes; the next local transcription
+    reloads the model from the on-disk weights.
+    """
+    _get_batched_whisper_pipeline.clear()
+    _get_whisper_model.clear()
+    _start_whisper_prewarm.clear()
+    gc.collect()
 
-def transcribe_audio_with_local_gpu(audio_path: Path, progress_callback: Optional[callable] = None) -> Any:
+
+def transcribe_audio_with_local_gpu(audio_path: Path, progress_callback: Optional[callable] = None) -> TranscriptionResult:
     """
     Transcribe audio file using local GPU with faster-whisper.
     
     Uses the GTX 1080 GPU for fast, free transcription.
-    Model is cached after first load for better performance.
+    Model is cached after first load for better performance. The audio is never
+    split: faster-whisper decodes the full file in 30-second windows, so the
+    Whisper API size limit does not apply here.
     
     Args:
         audio_path: Path to audio file
         progress_callback: Optional callback function(progress: int, message: str) for UI updates
         
     Returns:
-        Transcription result object with segments and text (compatible with OpenAI format)
+        TranscriptionResult with segments and text
         
     Raises:
         TranscriptionError: If transcription fails
     """
-    global _gpu_model_cache
-    
     try:
         # Load model (cached after first use)
-        if _gpu_model_cache is None:
-            logger.info("Loading Whisper model on GPU (first time, may take a few seconds)...")
-            if progress_callback:
-                progress_callback(30, "🎮 Loading Whisper model on GPU...")
-            
-            # Use small model with int8 for GTX 1080 (best balance of speed/quality)
-            _gpu_model_cache = WhisperModel("small", device="cuda", compute_type="int8")
-            logger.info("Whisper model loaded on GPU")
+        if progress_callback:
+            progress_callback(30, "🎮 Loading Whisper model on GPU...")
+        model_key = (config.whisper_model_size, config.whisper_device, config.whisper_compute_type)
+        batched = config.whisper_batch_size > 1
+        model = _get_batched_whisper_pipeline(*model_key) if batched else _get_whisper_model(*model_key)
+        batch_options = {"batch_size": config.whisper_batch_size} if batched else {}
         
         if progress_callback:
             progress_callback(32, "🎮 Transcribing with local GPU (faster-whisper)...")
@@ -1447,11 +2124,14 @@ def transcribe_audio_with_local_gpu(audio_path: Path, progress_callback: Optiona
         
         # Transcribe
         def _gpu_transcription():
-            return _gpu_model_cache.transcribe(
+            return model.transcribe(
                 str(audio_path),
                 language="en",
-                beam_size=5,
-                word_timestamps=False
+                beam_size=config.whisper_beam_size,
+                word_timestamps=False,
+                vad_filter=config.whisper_vad_filter,
+                vad_parameters={"min_silence_duration_ms": 500},
+                **batch_options
             )
 
         segments_iter, info = _run_with_backoff(
@@ -1464,59 +2144,97 @@ def transcribe_audio_with_local_gpu(audio_path: Path, progress_callback: Optiona
             context=audio_path.name
         )
         
-        # Collect segments and build text
+        # Keep only start/end/text: faster-whisper Segments also carry token ids,
+        # log-probs and word lists that nothing downstream reads
         segments_list = []
-        full_text_parts = []
-        last_progress_update = 0
+        append_segment = segments_list.append
+        duration = info.duration
+        progress_step_s = duration * 0.05  # Report every 5% of the audio
+        next_progress_s = progress_step_s
         
         for segment in segments_iter:
-            # Convert faster-whisper segment to compatible format
-            seg_dict = {
-                'start': segment.start,
-                'end': segment.end,
-                'text': segment.text
-            }
-            segments_list.append(seg_dict)
-            full_text_parts.append(segment.text)
+            end = segment.end
+            append_segment({'start': segment.start, 'end': end, 'text': segment.text})
             
             # Update progress periodically (every 5%)
-            if info.duration > 0:
-                progress_pct = (segment.end / info.duration) * 100
-                if progress_pct - last_progress_update >= 5:
-                    current_progress = 32 + int((progress_pct / 100) * 18)  # 32-50% range
-                    if progress_callback:
-                        progress_callback(current_progress, f"🎮 GPU transcribing... {progress_pct:.0f}%")
-                    last_progress_update = progress_pct
-        
-        full_text = " ".join(full_text_parts)
-        
-        logger.info(f"GPU transcription complete: {len(segments_list)} segments, {len(full_text.split())} words")
-        
-        # Create result object compatible with OpenAI format
-        class GPUTranscriptionResult:
-            """GPU transcription result compatible with OpenAI Whisper format."""
-            def __init__(self, segments: List[Dict], text: str):
-                # Convert dict segments to objects with attributes
-                class Segment:
-                    def __init__(self, start, end, text):
-                        self.start = start
-                        self.end = end
-                        self.text = text
-                
-                self.segments = [Segment(s['start'], s['end'], s['text']) for s in segments]
-                self.text = text
+            if duration > 0 and end >= next_progress_s:
+                progress_pct = (end / duration) * 100
+                current_progress = 32 + int((progress_pct / 100) * 18)  # 32-50% range
+                if progress_callback:
+                    progress_callback(current_progress, f"🎮 GPU transcribing... {progress_pct:.0f}%")
+                next_progress_s = end + progress_step_s
+        
+        full_text = " ".join(seg['text'] for seg in segments_list)
+        
+        # Word count is logged once by the caller; avoid another split of the full text here
+        logger.info(f"GPU transcription complete: {len(segments_list)} segments, {len(full_text)} characters")
         
-        return GPUTranscriptionResult(segments_list, full_text)
+        return TranscriptionResult(segments_list, full_text)
         
     except Exception as e:
         logger.error(f"GPU transcription failed: {e}")
         raise TranscriptionError(f"GPU transcription failed: {str(e)}") from e
 
 
+# -----------------------------
+# TRANSCRIPT CACHE
+# -----------------------------
+def _transcription_cache_key(audio_path: Path, use_local_gpu: bool) -> bytes:
+    """
+    Digest the audio bytes together with the settings that shape the transcript.
+    
+    Args:
+        audio_path: Path to audio file
+        use_local_gpu: Whether the local model (vs the Whisper API) transcribes it
+        
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    if use_local_gpu:
+        settings = (
+            f"local:{config.whisper_model_size}:{config.whisper_beam_size}:{config.whisper_batch_size}:"
+            f"{config.whisper_vad_filter}:{config.whisper_compute_type}:{config.whisper_device}"
+        )
+    else:
+        settings = f"api:whisper-1:{config.audio_chunk_size_mb}:{config.audio_chunk_overlap_ms}"
+    
+    digest = hashlib.blake2b(settings.encode(), digest_size=16)
+    with open(audio_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _load_cached_transcription(cache_key: bytes) -> Optional[TranscriptionResult]:
+    """Return a previously stored transcription, or None on a miss or cache failure."""
+    try:
+        cached = db_manager.get_transcript_cache(cache_key)
+    except Exception as e:
+        logger.warning(f"Transcript cache lookup failed: {e}")
+        return None
+    if cached is None:
+        return None
+    segments_json, text = cached
+    return TranscriptionResult(orjson.loads(segments_json), text)
+
+
+def _store_cached_transcription(cache_key: bytes, result: TranscriptionResult) -> None:
+    """Store a transcription for reuse; failures are logged, never raised."""
+    try:
+        db_manager.put_transcript_cache(cache_key, orjson.dumps(result.segments), result.text)
+    except Exception as e:
+        logger.warning(f"Failed to cache transcription: {e}")
+
+
 # -----------------------------
 # SUMMARIZATION & KEY FACTORS
 # -----------------------------
-def call_openai_with_retry(messages: List[Dict[str, str]], max_tokens: int, max_retries: int = 3) -> str:
+def call_openai_with_retry(
+    messages: List[Dict[str, str]],
+    max_tokens: int,
+    max_retries: int = 3,
+    response_format: Optional[Dict[str, str]] = None
+) -> str:
     """
     Call OpenAI API with retry logic and better error handling.
     
@@ -1524,6 +2242,7 @@ def call_openai_with_retry(messages: List[Dict[str, str]], max_tokens: int, max_
         messages: List of message dictionaries for chat completion
         max_tokens: Maximum tokens in response
         max_retries: Maximum number of retry attempts
+        response_format: Optional response format (e.g. {"type": "json_object"})
         
     Returns:
         Response content string
@@ -1537,12 +2256,31 @@ def call_openai_with_retry(messages: List[Dict[str, str]], max_tokens: int, max_
     if client is None:
         raise ValueError("OpenAI client is not initialized. Check OPENAI_API_KEY.")
 
+    # Identical prompts against the same model return the cached answer
+    cache_key = hashlib.blake2b(
+        orjson.dumps([config.openai_model, max_tokens, response_format, messages]),
+        digest_size=16
+    ).digest()
+    try:
+        cached = db_manager.get_llm_cache(cache_key)
+    except Exception as e:
+        logger.warning(f"LLM cache lookup failed: {e}")
+        cached = None
+    if cached is not None:
+        logger.info(f"OpenAI chat completion served from cache, model={config.openai_model}")
+        return cached
+
+    request_options: Dict[str, Any] = {}
+    if response_format is not None:
+        request_options["response_format"] = response_format
+
     def _chat_call():
         return client.chat.completions.create(
             model=config.openai_model,
             messages=messages,
             max_tokens=max_tokens,
-            timeout=config.api_timeout_seconds
+            timeout=config.api_timeout_seconds,
+            **request_options
         )
 
     try:
@@ -1582,7 +2320,36 @@ def call_openai_with_retry(messages: List[Dict[str, str]], max_tokens: int, max_
         f"OpenAI chat completion tokens={tokens_used or 'unknown'}, model={config.openai_model}"
     )
 
-    return response.choices[0].message.content
+    choice = response.choices[0]
+    content = choice.message.content
+    # Only cache complete answers: a reply cut off at max_tokens (or JSON that
+    # does not parse) would otherwise be replayed on every later run
+    if content and choice.finish_reason == "stop" and _is_cacheable_reply(content, response_format):
+        try:
+            db_manager.put_llm_cache(cache_key, content)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+    return content
+
+
+def _is_cacheable_reply(content: str, response_format: Optional[Dict[str, str]]) -> bool:
+    """
+    Check that a reply is usable for its requested format before it is cached.
+    
+    Args:
+        content: Reply text
+        response_format: Response format the request asked for
+        
+    Returns:
+        False for a JSON-mode reply that is not valid JSON, True otherwise
+    """
+    if response_format is None or response_format.get("type") != "json_object":
+        return True
+    try:
+        orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return False
+    return True
 
 
 def validate_and_truncate_text(text: str, max_length: Optional[int] = None) -> str:
@@ -1682,6 +2449,103 @@ def extract_key_factors(text: str) -> str:
     return call_openai_with_retry(messages, config.key_factors_max_tokens)
 
 
+def condense_long_text(text: str) -> str:
+    """
+    Map step for text longer than one GPT request allows.
+    
+    Splits the text into overlapping windows that each fit within
+    max_text_input_length, summarizes the windows concurrently and joins the
+    partial summaries in order, so the analysis covers the whole text instead
+    of only its beginning.
+    
+    Args:
+        text: Transcript or document text
+        
+    Returns:
+        Text unchanged if it already fits, otherwise the joined partial summaries
+        
+    Raises:
+        ValueError: If client is not initialized
+        APIQuotaError: If API quota exceeded
+        APIConnectionError: If connection fails
+    """
+    max_length = config.max_text_input_length
+    if len(text) <= max_length:
+        return text
+    
+    windows = []
+    start = 0
+    while start < len(text):
+        end = min(start + max_length, len(text))
+        if end < len(text):
+            # Prefer to cut on whitespace so a window never ends mid-word
+            space = text.rfind(" ", start + max_length // 2, end)
+            if space != -1:
+                end = space
+        windows.append(text[start:end])
+        if end == len(text):
+            break
+        start = max(end - config.long_text_overlap_chars, start + 1)
+    
+    logger.info(f"Text too long ({len(text)} chars); condensing {len(windows)} windows before analysis")
+    with ThreadPoolExecutor(max_workers=max(1, min(config.llm_max_workers, len(windows)))) as executor:
+        partial_summaries = list(executor.map(summarize_text, windows))
+    
+    return "\n\n".join(
+        f"Part {i} of {len(windows)}:\n{summary}"
+        for i, summary in enumerate(partial_summaries, start=1)
+    )
+
+
+def analyze_text(text: str) -> Tuple[str, str, str]:
+    """
+    Generate summary, key factors and title in a single GPT request.
+    
+    The transcript is sent once and the model answers all three tasks as one
+    JSON object, instead of paying for the same input tokens three times. If
+    the reply is not usable JSON, falls back to the separate prompts, issued
+    concurrently. Text longer than one request allows is first condensed
+    window by window (see condense_long_text) rather than cut off.
+    
+    Args:
+        text: Transcript or document text
+        
+    Returns:
+        Tuple of (summary, key_factors, title)
+        
+    Raises:
+        ValueError: If client is not initialized
+        APIQuotaError: If API quota exceeded
+        APIConnectionError: If connection fails
+    """
+    truncated = validate_and_truncate_text(condense_long_text(text))
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant that analyzes transcripts and replies in JSON."},
+        {"role": "user", "content": PROMPTS["analyze"].format(text=truncated)}
+    ]
+    max_tokens = config.summary_max_tokens + config.key_factors_max_tokens + config.title_max_tokens
+    
+    reply = call_openai_with_retry(messages, max_tokens, response_format={"type": "json_object"})
+    try:
+        analysis = orjson.loads(reply or "")
+        summary, key_factors, title = (analysis[key] for key in ("summary", "key_factors", "title"))
+        if not all(isinstance(part, str) and part.strip() for part in (summary, key_factors, title)):
+            raise ValueError("missing or empty field")
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Combined analysis reply unusable ({e}); falling back to separate prompts")
+        # The three prompts are independent, so pay for one round-trip, not three.
+        # They get the already-truncated text, so none of them slices it again.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(task, truncated)
+                for task in (summarize_text, extract_key_factors, extract_title_from_transcript)
+            ]
+            summary, key_factors, title = (future.result() for future in futures)
+        return summary, key_factors, title
+    
+    return summary, key_factors, title.strip().strip('"\'')
+
+
 # -----------------------------
 # BUSINESS LOGIC (No UI Code)
 # -----------------------------
@@ -1706,7 +2570,7 @@ def process_youtube_video(
             - session_dir: Output directory path
             - metadata: Video metadata dict
             - full_text: Transcript text
-            - timestamped_lines: List of timestamped transcript lines
+            - timestamped_text: Timestamped transcript text
             - summary: Generated summary
             - key_factors: Extracted key factors
             - file_size: Audio file size in MB
@@ -1720,13 +2584,8 @@ def process_youtube_video(
         """Helper to update progress if callback is provided."""
         if progress_callback:
             progress_callback(pct, msg)
-        # Log with emoji fallback for Windows console
-        try:
-            logger.info(f"Progress: {pct}% - {msg}")
-        except UnicodeEncodeError:
-            # Strip emojis for Windows console if needed
-            msg_no_emoji = msg.encode('ascii', 'ignore').decode('ascii')
-            logger.info(f"Progress: {pct}% - {msg_no_emoji}")
+        # Console encoding is handled once by the log formatter
+        logger.info(f"Progress: {pct}% - {msg}")
     
     try:
         logger.info(f"Processing YouTube video: {sanitize_url_for_log(url)}")
@@ -1734,8 +2593,8 @@ def process_youtube_video(
         
         # Download audio
         update_progress(15, "⬇️ Downloading audio...")
-        logger.info("Step 1/6: Downloading audio...")
-        audio_path, video_info = download_audio(url, session_dir)
+        logger.info("Step 1/4: Downloading audio...")
+        audio_path, video_info = download_audio(url, session_dir, fit_api_upload=not use_local_gpu)
         video_title = video_info.get('title', 'Unknown Video') if video_info else 'Unknown Video'
         logger.info(f"Audio downloaded successfully: {video_title}")
         update_progress(25, f"✅ Audio downloaded: {video_title[:40]}...")
@@ -1747,74 +2606,63 @@ def process_youtube_video(
         file_size = audio_path.stat().st_size / (1024 * 1024)  # MB
         logger.info(f"Audio file size: {file_size:.2f} MB")
         
-        # Note: Large files (>24MB) will be automatically split into chunks
-        # by the transcribe_audio_with_timestamps function
-        if file_size > config.max_audio_file_size_mb:
+        # Note: Large files (>24MB) are split into chunks only for the Whisper API
+        # (upload size limit); faster-whisper streams the whole file in 30s windows
+        if file_size > config.max_audio_file_size_mb and not use_local_gpu:
             logger.info(f"Audio file ({file_size:.2f} MB) exceeds single-file limit. Will use automatic chunking.")
         
-        # Transcribe audio (choose method based on user selection)
-        if use_local_gpu:
+        # Transcribe audio (choose method based on user selection), unless this
+        # exact audio was already transcribed with the same settings
+        cache_key = _transcription_cache_key(audio_path, use_local_gpu)
+        result = _load_cached_transcription(cache_key)
+        if result is not None:
+            update_progress(30, "♻️ Reusing cached transcript for this audio...")
+            logger.info("Step 2/4: Transcript cache hit - skipping transcription")
+        elif use_local_gpu:
             update_progress(30, "🎮 Transcribing audio with local GPU...")
-            logger.info("Step 2/6: Transcribing audio with local GPU (faster-whisper)...")
+            logger.info("Step 2/4: Transcribing audio with local GPU (faster-whisper)...")
             result = transcribe_audio_with_local_gpu(audio_path, progress_callback=progress_callback)
+            _store_cached_transcription(cache_key, result)
         else:
+            # The API path never needs the local model; don't keep it pinned in VRAM
+            release_whisper_model()
             update_progress(30, "🎤 Transcribing audio with OpenAI Whisper API...")
-            logger.info("Step 2/6: Transcribing audio with OpenAI Whisper API...")
+            logger.info("Step 2/4: Transcribing audio with OpenAI Whisper API...")
             result = transcribe_audio_with_timestamps(audio_path, progress_callback=progress_callback)
+            _store_cached_transcription(cache_key, result)
         
         segments = result.segments if hasattr(result, 'segments') else []
         full_text = result.text if hasattr(result, 'text') else ""
-        logger.info(f"Transcription received: {len(segments)} segments, {len(full_text.split())} words")
-        update_progress(50, f"✅ Transcribed: {len(full_text.split())} words")
+        # Count words once; the log, progress message and metadata all reuse it
+        word_count = len(full_text.split())
+        logger.info(f"Transcription received: {len(segments)} segments, {word_count} words")
+        update_progress(50, f"✅ Transcribed: {word_count} words")
         
-        # Save transcription files
+        # Save transcription files (plain, timestamped and SRT) in the
+        # background while GPT analyzes the transcript
         update_progress(52, "💾 Saving transcription files...")
-        logger.info("Step 3/6: Saving transcription files...")
-        if not safe_write_text(session_dir / "transcript.txt", full_text):
-            raise IOError("Failed to save transcript file")
-        
-        # Create timestamped transcript
-        timestamped_lines = []
-        for seg in segments:
-            start = format_timestamp(seg.start)
-            end = format_timestamp(seg.end)
-            timestamped_lines.append(f"[{start} → {end}]\n{seg.text.strip()}\n")
-        
-        if not safe_write_text(session_dir / "transcript_with_timestamps.txt", "\n".join(timestamped_lines)):
-            raise IOError("Failed to save timestamped transcript file")
-        
-        # Create SRT subtitle file
-        srt_segments = [{"start": seg.start, "end": seg.end, "text": seg.text} for seg in segments]
-        srt_output = to_srt(srt_segments)
-        if not safe_write_text(session_dir / "transcript.srt", srt_output):
-            raise IOError("Failed to save SRT file")
+        logger.info("Step 3/4: Saving transcription files...")
+        with ThreadPoolExecutor(max_workers=2) as transcript_writer:
+            transcript_saved = transcript_writer.submit(safe_write_text, session_dir / "transcript.txt", full_text)
+            timestamped_saved = transcript_writer.submit(
+                write_transcript_files,
+                segments,
+                session_dir / "transcript_with_timestamps.txt",
+                session_dir / "transcript.srt"
+            )
+            
+            # Generate summary, key factors and title in one request
+            update_progress(65, "📝 Generating summary, key factors and title with GPT...")
+            logger.info("Step 4/4: Analyzing transcript with GPT...")
+            summary, key_factors, transcript_title = analyze_text(full_text)
         
+        if not transcript_saved.result():
+            raise IOError("Failed to save transcript file")
+        try:
+            timestamped_text = timestamped_saved.result()
+        except OSError as e:
+            raise IOError(f"Failed to save timestamped transcript files: {e}") from e
         logger.info("Transcription files saved successfully")
-        update_progress(60, "✅ Transcription files saved")
-        
-        # Generate summary
-        update_progress(65, "📝 Generating summary with GPT...")
-        logger.info("Step 4/6: Generating summary with GPT...")
-        summary = summarize_text(full_text)
-        if not safe_write_text(session_dir / "summary.txt", summary):
-            raise IOError("Failed to save summary file")
-        logger.info("Summary generated successfully")
-        update_progress(75, "✅ Summary generated")
-        
-        # Extract key factors
-        update_progress(80, "🎯 Extracting key factors with GPT...")
-        logger.info("Step 5/6: Extracting key factors with GPT...")
-        key_factors = extract_key_factors(full_text)
-        if not safe_write_text(session_dir / "key_factors.txt", key_factors):
-            raise IOError("Failed to save key factors file")
-        logger.info("Key factors extracted successfully")
-        update_progress(90, "✅ Key factors extracted")
-        
-        # Generate content-based title
-        update_progress(95, "📋 Generating content-based title...")
-        logger.info("Step 6/6: Generating content-based title...")
-        transcript_title = extract_title_from_transcript(full_text)
-        logger.info(f"Content title generated: {transcript_title}")
         
         # Create metadata
         metadata = {
@@ -1823,12 +2671,17 @@ def process_youtube_video(
             "transcript_title": transcript_title,
             "timestamp": datetime.now().isoformat(),
             "video_id": session_dir.name,
-            "word_count": len(full_text.split()),
+            "word_count": word_count,
             "segment_count": len(segments),
         }
         
-        if not safe_write_text(session_dir / "metadata.json", json.dumps(metadata, indent=4)):
-            raise IOError("Failed to save metadata file")
+        write_output_files([
+            ("summary", session_dir / "summary.txt", summary),
+            ("key factors", session_dir / "key_factors.txt", key_factors),
+            ("metadata", session_dir / "metadata.json", orjson.dumps(metadata, option=orjson.OPT_INDENT_2)),
+        ])
+        logger.info(f"Analysis complete, content title: {transcript_title}")
+        update_progress(95, "✅ Summary, key factors and title generated")
         
         # Save to database
         update_progress(97, "💾 Saving to database...")
@@ -1871,7 +2724,7 @@ def process_youtube_video(
             "session_dir": session_dir,
             "metadata": metadata,
             "full_text": full_text,
-            "timestamped_lines": timestamped_lines,
+            "timestamped_text": timestamped_text,
             "summary": summary,
             "key_factors": key_factors,
             "file_size": file_size,
@@ -1882,7 +2735,7 @@ def process_youtube_video(
         # Cleanup partial files on failure
         if session_dir.exists():
             try:
-                shutil.rmtree(session_dir)
+                remove_tree_in_background(session_dir)
                 logger.info(f"Cleaned up failed processing directory: {session_dir}")
             except Exception as cleanup_error:
                 logger.warning(f"Failed to cleanup directory {session_dir}: {cleanup_error}")
@@ -1890,7 +2743,8 @@ def process_youtube_video(
 
 
 def process_document(
-    uploaded_file: Any, 
+    file_bytes: bytes,
+    filename: str,
     session_dir: Path,
     progress_callback: Optional[callable] = None
 ) -> Dict[str, Any]:
@@ -1899,7 +2753,8 @@ def process_document(
     Can be tested independently and reused in CLI, API, or other contexts.
     
     Args:
-        uploaded_file: Uploaded file object (or file-like object for testing)
+        file_bytes: Document content, read once by the caller
+        filename: Original document filename
         session_dir: Directory to save output files
         progress_callback: Optional callback function(progress: int, message: str) for UI updates
         
@@ -1922,69 +2777,55 @@ def process_document(
         """Helper to update progress if callback is provided."""
         if progress_callback:
             progress_callback(pct, msg)
-        # Log with emoji fallback for Windows console
-        try:
-            logger.info(f"Progress: {pct}% - {msg}")
-        except UnicodeEncodeError:
-            # Strip emojis for Windows console if needed
-            msg_no_emoji = msg.encode('ascii', 'ignore').decode('ascii')
-            logger.info(f"Progress: {pct}% - {msg_no_emoji}")
+        # Console encoding is handled once by the log formatter
+        logger.info(f"Progress: {pct}% - {msg}")
 
     try:
-        logger.info(f"Processing document: {uploaded_file.name}")
+        logger.info(f"Processing document: {filename}")
         update_progress(10, f"📄 Starting document processing...")
         
         # Extract text from document
         update_progress(20, "📖 Extracting text from document...")
-        logger.info("Step 1/4: Extracting text from document...")
-        full_text = extract_text_from_document(uploaded_file)
+        logger.info("Step 1/2: Extracting text from document...")
+        full_text = extract_text_from_bytes(file_bytes, filename)
         
         if not full_text.strip():
             raise DocumentProcessingError("No text could be extracted from the document.")
         
-        logger.info(f"Text extracted: {len(full_text.split())} words, {len(full_text)} characters")
-        update_progress(40, f"✅ Extracted: {len(full_text.split())} words")
+        # Count words once; the log, progress message and metadata all reuse it
+        word_count = len(full_text.split())
+        logger.info(f"Text extracted: {word_count} words, {len(full_text)} characters")
+        update_progress(40, f"✅ Extracted: {word_count} words")
         
-        # Save original text
-        if not safe_write_text(session_dir / "extracted_text.txt", full_text):
-            raise IOError("Failed to save extracted text file")
+        # Save original text in the background while GPT analyzes it
+        with ThreadPoolExecutor(max_workers=1) as text_writer:
+            text_saved = text_writer.submit(safe_write_text, session_dir / "extracted_text.txt", full_text)
+            
+            # Generate summary, key factors and title in one request
+            update_progress(50, "📝 Generating summary, key factors and title with GPT...")
+            logger.info("Step 2/2: Analyzing document with GPT...")
+            summary, key_factors, content_title = analyze_text(full_text)
         
-        # Generate summary
-        update_progress(50, "📝 Generating summary with GPT...")
-        logger.info("Step 2/4: Generating summary with GPT...")
-        summary = summarize_text(full_text)
-        if not safe_write_text(session_dir / "summary.txt", summary):
-            raise IOError("Failed to save summary file")
-        logger.info("Summary generated successfully")
-        update_progress(70, "✅ Summary generated")
-        
-        # Extract key factors
-        update_progress(75, "🎯 Extracting key factors with GPT...")
-        logger.info("Step 3/4: Extracting key factors with GPT...")
-        key_factors = extract_key_factors(full_text)
-        if not safe_write_text(session_dir / "key_factors.txt", key_factors):
-            raise IOError("Failed to save key factors file")
-        logger.info("Key factors extracted successfully")
-        update_progress(90, "✅ Key factors extracted")
-        
-        # Generate content-based title
-        update_progress(95, "📋 Generating content-based title...")
-        logger.info("Step 4/4: Generating content-based title...")
-        content_title = extract_title_from_transcript(full_text)
-        logger.info(f"Content title generated: {content_title}")
+        if not text_saved.result():
+            raise IOError("Failed to save extracted text file")
         
         # Create metadata
         metadata = {
-            "filename": uploaded_file.name,
+            "filename": filename,
             "content_title": content_title,
             "timestamp": datetime.now().isoformat(),
             "doc_id": session_dir.name,
-            "word_count": len(full_text.split()),
+            "word_count": word_count,
             "character_count": len(full_text),
         }
         
-        if not safe_write_text(session_dir / "metadata.json", json.dumps(metadata, indent=4)):
-            raise IOError("Failed to save metadata file")
+        write_output_files([
+            ("summary", session_dir / "summary.txt", summary),
+            ("key factors", session_dir / "key_factors.txt", key_factors),
+            ("metadata", session_dir / "metadata.json", orjson.dumps(metadata, option=orjson.OPT_INDENT_2)),
+        ])
+        logger.info(f"Analysis complete, content title: {content_title}")
+        update_progress(95, "✅ Summary, key factors and title generated")
         
         # Save to database
         update_progress(97, "💾 Saving to database...")
@@ -1992,9 +2833,9 @@ def process_document(
             from database import Project
             project = Project(
                 type='document',
-                title=uploaded_file.name,
+                title=filename,
                 content_title=content_title,
-                source=uploaded_file.name,
+                source=filename,
                 created_at=metadata['timestamp'],
                 word_count=metadata['word_count'],
                 segment_count=0,
@@ -2009,7 +2850,7 @@ def process_document(
             # Don't fail the whole process if database save fails
         
         update_progress(100, "✅ Processing complete!")
-        logger.info(f"✅ Processing completed successfully for: {uploaded_file.name}")
+        logger.info(f"✅ Processing completed successfully for: {filename}")
         
         # Return all results for display
         return {
@@ -2021,77 +2862,332 @@ def process_document(
         }
     
     except Exception as e:
-        logger.error(f"Processing failed for {uploaded_file.name}: {e}")
+        logger.error(f"Processing failed for {filename}: {e}")
         # Cleanup partial files on failure
         if session_dir.exists():
             try:
-                shutil.rmtree(session_dir)
+                remove_tree_in_background(session_dir)
                 logger.info(f"Cleaned up failed processing directory: {session_dir}")
             except Exception as cleanup_error:
                 logger.warning(f"Failed to cleanup directory {session_dir}: {cleanup_error}")
         raise
 
 
-# -----------------------------
-# UI RENDERING (Streamlit-specific)
-# -----------------------------
-def render_youtube_results(results: Dict[str, Any]) -> None:
+def load_saved_results(session_dir: Path) -> Optional[Dict[str, Any]]:
     """
-    Render YouTube processing results in Streamlit UI.
+    Load the results of a previously completed run from its project directory.
     
     Args:
-        results: Processing results dictionary from process_youtube_video
+        session_dir: Project directory that may hold saved output files
+        
+    Returns:
+        Results dictionary shaped like process_youtube_video/process_document output,
+        or None if the directory does not contain a completed project
     """
-    session_dir = results["session_dir"]
+    metadata_file = session_dir / "metadata.json"
+    if not metadata_file.exists():
+        return None
     
-    st.subheader("📄 Transcript")
-    with st.expander("View Full Transcript"):
-        st.text(results["full_text"])
-
-    st.subheader("⏱️ Timestamped Transcript")
-    with st.expander("View Timestamped Transcript"):
-        st.text("\n".join(results["timestamped_lines"]))
-
-    st.subheader("📝 Summary")
-    with st.expander("View Summary"):
-        st.markdown(results["summary"])
-
-    st.subheader("🎯 Key Factors")
-    with st.expander("View Key Factors"):
-        st.markdown(results["key_factors"])
+    try:
+        metadata = orjson.loads(metadata_file.read_bytes())
+        results = {
+            "session_dir": session_dir,
+            "metadata": metadata,
+            "summary": (session_dir / "summary.txt").read_text(encoding="utf-8"),
+            "key_factors": (session_dir / "key_factors.txt").read_text(encoding="utf-8"),
+        }
+        if "url" in metadata:
+            results["full_text"] = (session_dir / "transcript.txt").read_text(encoding="utf-8")
+            results["timestamped_text"] = (
+                session_dir / "transcript_with_timestamps.txt"
+            ).read_text(encoding="utf-8")
+            results["file_size"] = 0.0  # Audio is removed after a successful run
+        else:
+            results["full_text"] = (session_dir / "extracted_text.txt").read_text(encoding="utf-8")
+        return results
+    except (orjson.JSONDecodeError, IOError, OSError) as e:
+        logger.warning(f"Saved results in {session_dir.name} are incomplete: {e}")
+        return None
 
-    st.subheader("⬇️ Download Files")
-    col1, col2, col3 = st.columns(3)
 
-    with col1:
-        st.download_button("📄 Transcript (TXT)", read_file_bytes(session_dir / "transcript.txt"),
-                          file_name="transcript.txt")
-        st.download_button("⏱️ Timestamped (TXT)", read_file_bytes(session_dir / "transcript_with_timestamps.txt"),
-                          file_name="transcript_with_timestamps.txt")
+_PROJECT_CLAIM_FILE = ".claim"
 
-    with col2:
-        st.download_button("🎬 Subtitles (SRT)", read_file_bytes(session_dir / "transcript.srt"),
-                          file_name="transcript.srt")
-        st.download_button("📝 Summary (TXT)", read_file_bytes(session_dir / "summary.txt"),
-                          file_name="summary.txt")
 
-    with col3:
-        st.download_button("🎯 Key Factors (TXT)", read_file_bytes(session_dir / "key_factors.txt"),
-                          file_name="key_factors.txt")
-        st.download_button("📊 Metadata (JSON)", read_file_bytes(session_dir / "metadata.json"),
-                          file_name="metadata.json")
+def _process_is_running(pid: int) -> bool:
+    """
+    Check whether a process with the given PID exists on this machine.
+    
+    Args:
+        pid: Process ID to look up
+        
+    Returns:
+        False only if the process is known to be gone
+    """
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return kernel32.GetLastError() == 5  # ERROR_ACCESS_DENIED: exists, owned by someone else
+        try:
+            exit_code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+            return exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
 
 
-def render_document_results(results: Dict[str, Any]) -> None:
+def _claim_is_stale(session_dir: Path) -> bool:
     """
-    Render document processing results in Streamlit UI.
+    Check whether a project directory was claimed by a process that has since exited.
+    
+    Only provably abandoned claims count: the claim file must name this host
+    and a PID that is no longer running. A missing or unreadable claim file
+    (e.g. one being written right now) is treated as live.
     
     Args:
-        results: Processing results dictionary from process_document
+        session_dir: Project directory without saved results
+        
+    Returns:
+        True if the run that claimed the directory can no longer finish it
     """
-    session_dir = results["session_dir"]
+    try:
+        claim = orjson.loads((session_dir / _PROJECT_CLAIM_FILE).read_bytes())
+    except (orjson.JSONDecodeError, OSError):
+        return False
+    return claim.get("host") == socket.gethostname() and not _process_is_running(int(claim.get("pid", 0)))
+
+
+def claim_project_dir(session_dir: Path, reprocess: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Reuse a completed project, or claim its directory for a new run.
     
-    st.subheader("📄 Extracted Text")
+    The directory is created with mkdir(exist_ok=False), so when the same
+    source is submitted twice at once only one run processes it. The claim
+    records the owning host and PID; a directory without complete saved
+    results belongs to a run that is still going, unless that process has
+    exited (e.g. the app crashed mid-run), in which case it is taken over.
+    
+    Args:
+        session_dir: Project directory derived from the submission
+        reprocess: If True, move a saved project to trash and process it again
+        
+    Returns:
+        Saved results to reuse, or None if the caller now owns session_dir
+        and must process into it
+        
+    Raises:
+        ProjectInProgressError: If another run owns session_dir
+        IOError: If a saved project could not be replaced for reprocessing
+    """
+    if not reprocess:
+        results = load_saved_results(session_dir)
+        if results is not None:
+            return results
+    elif (session_dir / "metadata.json").exists():
+        # Trash keeps the previous run restorable
+        deletion = delete_project(session_dir.name)
+        if not deletion.disk_removed:
+            raise IOError(f"Could not replace saved project {session_dir.name}: {deletion.message}")
+    
+    if not (session_dir / "metadata.json").exists() and _claim_is_stale(session_dir):
+        # Renaming the claim file away succeeds for exactly one caller, so two
+        # runs finding the same abandoned directory cannot both take it over
+        try:
+            (session_dir / _PROJECT_CLAIM_FILE).rename(session_dir / f"{_PROJECT_CLAIM_FILE}.stale-{time.time_ns()}")
+        except OSError:
+            pass
+        else:
+            logger.info(f"Taking over abandoned project directory {session_dir.name}")
+            remove_tree_in_background(session_dir)
+    
+    try:
+        session_dir.mkdir(exist_ok=False)
+    except FileExistsError:
+        raise ProjectInProgressError(
+            "This submission is already being processed. Wait for it to finish, "
+            "or tick \"Reprocess\" if its saved results are incomplete."
+        ) from None
+    (session_dir / _PROJECT_CLAIM_FILE).write_bytes(
+        orjson.dumps({"host": socket.gethostname(), "pid": os.getpid()})
+    )
+    return None
+
+
+def process_youtube_batch(
+    urls: List[str],
+    progress_callback: Optional[callable] = None,
+    use_local_gpu: bool = False,
+    output_dir: Optional[Path] = None
+) -> List[Dict[str, Any]]:
+    """
+    Process several YouTube videos concurrently - pure business logic with no UI code.
+    
+    Library entry point for scripted batch runs; the Streamlit page processes
+    one video per submission.
+    
+    Each video spends most of its time waiting on yt-dlp and the OpenAI API,
+    so up to BATCH_MAX_WORKERS videos run at once. Whisper API uploads stay
+    under the shared WHISPER_RPM limiter. Local GPU transcription runs one
+    video at a time, since all runs share one model. Videos that were already
+    processed with the same method are loaded from disk, as in the
+    single-video flow; a video another run is processing fails with
+    ProjectInProgressError.
+    
+    Args:
+        urls: YouTube URLs to process
+        progress_callback: Optional function(progress: int, message: str) for
+            the combined progress of the whole batch; called from worker threads
+        use_local_gpu: If True, use local GPU transcription
+        output_dir: Directory that holds the project directories
+            (defaults to config.output_dir)
+        
+    Returns:
+        One dict per URL, in input order, with "url", "results" (the
+        process_youtube_video output, or None) and "error" (None, or the
+        exception that stopped that video)
+    """
+    if not urls:
+        return []
+    output_dir = output_dir or config.output_dir
+    
+    progress_by_item = [0] * len(urls)
+    progress_lock = threading.Lock()
+    
+    def report(index: int, progress: int, message: str) -> None:
+        if not progress_callback:
+            return
+        # Report under the lock so the combined percentage never goes backwards
+        with progress_lock:
+            progress_by_item[index] = progress
+            overall = sum(progress_by_item) // len(progress_by_item)
+            progress_callback(overall, f"[{index + 1}/{len(urls)}] {message}")
+    
+    def process_one(index: int, url: str) -> Dict[str, Any]:
+        item = {"url": url, "results": None, "error": None}
+        try:
+            if not validate_youtube_url(url):
+                raise ValueError(f"Invalid YouTube URL: {sanitize_url_for_log(url)}")
+            session_dir = output_dir / derive_project_id(url.strip(), _transcription_key(use_local_gpu))
+            item["results"] = claim_project_dir(session_dir)
+            if item["results"] is None:
+                item["results"] = process_youtube_video(
+                    url,
+                    session_dir,
+                    progress_callback=lambda progress, message: report(index, progress, message),
+                    use_local_gpu=use_local_gpu
+                )
+            report(index, 100, "✅ Done")
+        except Exception as e:
+            logger.error(f"Batch item {index + 1} failed for {sanitize_url_for_log(url)}: {e}")
+            item["error"] = e
+            report(index, 100, f"❌ Failed: {e}")
+        return item
+    
+    max_workers = 1 if use_local_gpu else max(1, min(config.batch_max_workers, len(urls)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(process_one, index, url) for index, url in enumerate(urls)]
+        return [future.result() for future in futures]
+
+
+# -----------------------------
+# UI RENDERING (Streamlit-specific)
+# -----------------------------
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _read_download_payload(path: str, mtime_ns: int) -> bytes:
+    """
+    Read a result file for a download button, once per file version.
+    
+    Args:
+        path: File path as a string
+        mtime_ns: File modification time; a rewritten file gets a new entry
+        
+    Returns:
+        File contents (shared, immutable bytes)
+    """
+    return read_file_bytes(Path(path))
+
+
+def download_payload(path: Path) -> bytes:
+    """
+    Get a result file's bytes for st.download_button without re-reading it on every rerun.
+    
+    Args:
+        path: Path to the result file
+        
+    Returns:
+        File contents as bytes
+        
+    Raises:
+        IOError: If file cannot be read
+    """
+    return _read_download_payload(str(path), path.stat().st_mtime_ns)
+
+
+def render_youtube_results(results: Dict[str, Any]) -> None:
+    """
+    Render YouTube processing results in Streamlit UI.
+    
+    Args:
+        results: Processing results dictionary from process_youtube_video
+    """
+    session_dir = results["session_dir"]
+    
+    st.subheader("📄 Transcript")
+    with st.expander("View Full Transcript"):
+        st.text(results["full_text"])
+
+    st.subheader("⏱️ Timestamped Transcript")
+    with st.expander("View Timestamped Transcript"):
+        st.text(results["timestamped_text"])
+
+    st.subheader("📝 Summary")
+    with st.expander("View Summary"):
+        st.markdown(results["summary"])
+
+    st.subheader("🎯 Key Factors")
+    with st.expander("View Key Factors"):
+        st.markdown(results["key_factors"])
+
+    st.subheader("⬇️ Download Files")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.download_button("📄 Transcript (TXT)", download_payload(session_dir / "transcript.txt"),
+                          file_name="transcript.txt")
+        st.download_button("⏱️ Timestamped (TXT)", download_payload(session_dir / "transcript_with_timestamps.txt"),
+                          file_name="transcript_with_timestamps.txt")
+
+    with col2:
+        st.download_button("🎬 Subtitles (SRT)", download_payload(session_dir / "transcript.srt"),
+                          file_name="transcript.srt")
+        st.download_button("📝 Summary (TXT)", download_payload(session_dir / "summary.txt"),
+                          file_name="summary.txt")
+
+    with col3:
+        st.download_button("🎯 Key Factors (TXT)", download_payload(session_dir / "key_factors.txt"),
+                          file_name="key_factors.txt")
+        st.download_button("📊 Metadata (JSON)", download_payload(session_dir / "metadata.json"),
+                          file_name="metadata.json")
+
+
+def render_document_results(results: Dict[str, Any]) -> None:
+    """
+    Render document processing results in Streamlit UI.
+    
+    Args:
+        results: Processing results dictionary from process_document
+    """
+    session_dir = results["session_dir"]
+    
+    st.subheader("📄 Extracted Text")
     with st.expander("View Full Text"):
         st.text(results["full_text"])
     
@@ -2108,56 +3204,241 @@ def render_document_results(results: Dict[str, Any]) -> None:
     
     with col1:
         st.download_button("📄 Extracted Text (TXT)", 
-                         read_file_bytes(session_dir / "extracted_text.txt"),
+                         download_payload(session_dir / "extracted_text.txt"),
                          file_name="extracted_text.txt")
     
     with col2:
         st.download_button("📝 Summary (TXT)", 
-                         read_file_bytes(session_dir / "summary.txt"),
+                         download_payload(session_dir / "summary.txt"),
                          file_name="summary.txt")
     
     with col3:
         st.download_button("🎯 Key Factors (TXT)", 
-                         read_file_bytes(session_dir / "key_factors.txt"),
+                         download_payload(session_dir / "key_factors.txt"),
                          file_name="key_factors.txt")
         st.download_button("📊 Metadata (JSON)", 
-                         read_file_bytes(session_dir / "metadata.json"),
+                         download_payload(session_dir / "metadata.json"),
                          file_name="metadata.json")
 
 
+@st.cache_data(max_entries=2)
+def _load_user_guide_blocks(guide_path: str, mtime: float) -> List[str]:
+    """
+    Read the user guide and split it into top-level sections for rendering.
+    
+    Splits before each `#`/`##` heading that is not inside a fenced code block,
+    so each section can be rendered as its own markdown element.
+    
+    Args:
+        guide_path: Path to USER_GUIDE.md
+        mtime: File modification time (part of the cache key so edits are picked up)
+        
+    Returns:
+        List of markdown blocks in document order
+    """
+    blocks: List[str] = []
+    current: List[str] = []
+    in_fence = False
+    
+    with open(guide_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith("```"):
+                in_fence = not in_fence
+            elif not in_fence and line.startswith(("# ", "## ")) and current:
+                blocks.append("".join(current))
+                current = []
+            current.append(line)
+    
+    if current:
+        blocks.append("".join(current))
+    return blocks
+
+
 # -----------------------------
 # PROJECT MANAGEMENT
 # -----------------------------
-@st.cache_data(ttl=60)  # Cache for 60 seconds
+@st.cache_resource
+def _project_metadata_index() -> Dict[str, Tuple[int, Dict[str, Any]]]:
+    """Process-wide {project dir name: (metadata.json mtime_ns, parsed metadata)} cache."""
+    return {}
+
+
+def _load_indexed_metadata(
+    index: Dict[str, Tuple[int, Dict[str, Any]]],
+    name: str,
+    path: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Return one project's metadata, re-parsing it only if its mtime changed.
+    
+    Args:
+        index: Shared metadata index to read and update
+        name: Project directory name
+        path: Project directory path
+        
+    Returns:
+        Copy of the project's metadata, or None if it has no readable metadata
+    """
+    metadata_file = os.path.join(path, "metadata.json")
+    try:
+        mtime_ns = os.stat(metadata_file).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Failed to stat metadata for {name}: {e}")
+        return None
+    
+    cached = index.get(name)
+    if cached is None or cached[0] != mtime_ns:
+        try:
+            with open(metadata_file, 'rb') as f:
+                metadata = orjson.loads(f.read())
+            metadata['project_dir'] = name
+            index[name] = cached = (mtime_ns, metadata)
+        except (orjson.JSONDecodeError, IOError) as e:
+            # Skip projects with corrupted metadata
+            logger.warning(f"Failed to load metadata from {name}: {e}")
+            index.pop(name, None)
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error loading metadata from {name}: {e}")
+            index.pop(name, None)
+            return None
+    # Hand out copies so callers cannot mutate the shared index
+    return dict(cached[1])
+
+
 def list_projects() -> List[Dict[str, Any]]:
     """
     List all project directories with their metadata.
     
+    Only metadata files whose mtime changed since the last call are parsed
+    again; unchanged projects cost one stat each. Writes made inside a project
+    (metadata updates, a run finishing) are seen on the next call, with no TTL.
+    Large directories are checked on a thread pool so filesystem latency
+    overlaps instead of adding up.
+    
     Returns:
         List of project metadata dictionaries, sorted by timestamp (newest first)
     """
-    projects = []
-    for project_dir in config.output_dir.iterdir():
-        if project_dir.is_dir():
-            metadata_file = project_dir / "metadata.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
-                        metadata['project_dir'] = project_dir.name
-                        projects.append(metadata)
-                except (json.JSONDecodeError, IOError) as e:
-                    # Skip projects with corrupted metadata
-                    logger.warning(f"Failed to load metadata from {project_dir.name}: {e}")
-                    continue
-                except Exception as e:
-                    logger.error(f"Unexpected error loading metadata from {project_dir.name}: {e}")
-                    continue
+    index = _project_metadata_index()
+    with os.scandir(config.output_dir) as entries:
+        project_dirs = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+    
+    def load(project_dir: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        return _load_indexed_metadata(index, *project_dir)
+    
+    if len(project_dirs) > 32:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            loaded = list(executor.map(load, project_dirs))
+    else:
+        loaded = [load(project_dir) for project_dir in project_dirs]
+    projects = [metadata for metadata in loaded if metadata is not None]
+    
+    # Forget projects that were deleted or moved to trash
+    for stale in index.keys() - {name for name, _ in project_dirs}:
+        index.pop(stale, None)
+    
     # Sort by timestamp, newest first
     projects.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
     return projects
 
 
+def _project_display_name(proj: Dict[str, Any], idx: int) -> Tuple[str, str]:
+    """
+    Build the sidebar icon and title for a project listing entry.
+    
+    Args:
+        proj: Project listing dictionary
+        idx: Position in the listing (used for untitled fallbacks)
+        
+    Returns:
+        Tuple of (icon, display name)
+    """
+    if 'url' in proj:
+        # For YouTube videos, prioritize transcript_title, then title
+        project_icon = "🎥"
+        
+        # Use transcript-based title if available, otherwise YouTube title
+        if 'transcript_title' in proj and proj['transcript_title']:
+            title = proj['transcript_title']
+        elif 'title' in proj and proj['title']:
+            title = proj['title']
+        else:
+            title = None
+        
+        if title:
+            # Truncate if too long
+            project_name = truncate_title(title)
+        else:
+            # Fallback to video ID extraction
+            if proj.get('url'):
+                vid_id = extract_video_id(str(proj['url']))
+                if vid_id:
+                    # Determine if it's a short or regular video
+                    if '/shorts/' in str(proj['url']):
+                        project_name = f"Short {vid_id[:11]}"
+                    else:
+                        project_name = f"Video {vid_id[:11]}"
+                else:
+                    project_name = f"Video {idx + 1}"
+            else:
+                project_name = f"Video {idx + 1}"
+    elif 'filename' in proj:
+        # For documents, use content_title if available, otherwise filename
+        project_icon = "📄"
+        
+        if 'content_title' in proj and proj['content_title']:
+            project_name = truncate_title(proj['content_title'])
+        else:
+            project_name = truncate_title(proj['filename'])
+    else:
+        project_icon = "📄"
+        project_name = f"Project {idx + 1}"
+    
+    return project_icon, project_name
+
+
+def _project_info_markdown(proj: Dict[str, Any]) -> str:
+    """
+    Build the read-only project details shown in a sidebar expander.
+    
+    The fields are rendered as one markdown block instead of one st.write
+    element each.
+    
+    Args:
+        proj: Project listing dictionary
+        
+    Returns:
+        Markdown with one "**Field:** value" line per available field
+    """
+    lines = []
+    if 'url' in proj and proj['url']:
+        lines.append("**Type:** YouTube Video")
+        if 'transcript_title' in proj and proj['transcript_title']:
+            lines.append(f"**Content Title:** {proj['transcript_title']}")
+        if 'title' in proj and proj['title']:
+            lines.append(f"**Video Title:** {proj['title']}")
+        lines.append(f"**URL:** {format_url_for_display(proj['url'])}")
+    elif 'filename' in proj and proj['filename']:
+        lines.append("**Type:** Document")
+        if 'content_title' in proj and proj['content_title']:
+            lines.append(f"**Content Title:** {proj['content_title']}")
+        lines.append(f"**File:** {proj['filename']}")
+    
+    # Format timestamp nicely
+    try:
+        dt = datetime.fromisoformat(proj['timestamp'])
+        lines.append(f"**Date:** {dt.strftime('%b %d, %Y %I:%M %p')}")
+    except (ValueError, KeyError) as e:
+        logger.warning(f"Failed to format timestamp for project {proj.get('project_dir', 'unknown')}: {e}")
+        lines.append(f"**Date:** {proj.get('timestamp', 'Unknown')[:19]}")
+    
+    lines.append(f"**Words:** {proj.get('word_count', 'N/A'):,}")
+    # Two trailing spaces force markdown line breaks within the single block
+    return "  \n".join(lines)
+
+
 @dataclass
 class DeletionResult:
     project_dir: str
@@ -2183,7 +3464,7 @@ def _read_project_metadata(project_path: Path) -> Dict[str, Any]:
     metadata_file = project_path / "metadata.json"
     if metadata_file.exists():
         try:
-            return json.loads(metadata_file.read_text(encoding="utf-8"))
+            return orjson.loads(metadata_file.read_bytes())
         except Exception as e:
             logger.warning(f"Failed to parse metadata for {project_path.name}: {e}")
     return {}
@@ -2197,23 +3478,30 @@ def _create_trash_destination(project_dir_name: str) -> Path:
 
 
 def _append_deletion_log(entry: Dict[str, Any]) -> None:
+    _append_deletion_log_entries([entry])
+
+
+def _append_deletion_log_entries(entries: List[Dict[str, Any]]) -> None:
     log_dir = config.data_root / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / "deletions.log"
-    entry['timestamp'] = datetime.now().isoformat()
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    timestamp = datetime.now().isoformat()
+    with log_file.open("ab") as f:
+        for entry in entries:
+            entry['timestamp'] = timestamp
+            f.write(orjson.dumps(entry) + b"\n")
 
 
-def delete_project(project_dir_name: str) -> DeletionResult:
+def _trash_project_files(project_dir_name: str) -> Tuple[DeletionResult, Optional[List[str]]]:
     """
-    Delete a project directory, remove its database entry, and log the action.
+    Validate a project directory, look up its database row and move its files to trash.
     
     Args:
         project_dir_name: Name of project directory to delete
         
     Returns:
-        DeletionResult describing the outcome.
+        Tuple of (result, message parts). Message parts are None when the
+        directory name was rejected; result.message then holds the reason.
     """
     result = DeletionResult(project_dir=project_dir_name)
 
@@ -2227,12 +3515,7 @@ def delete_project(project_dir_name: str) -> DeletionResult:
     if not is_valid:
         result.message = error_msg or "Invalid directory name."
         logger.warning(f"Invalid project directory name: {project_dir_name} - {error_msg}")
-        _append_deletion_log({
-            "action": "delete",
-            "project_dir": project_dir_name,
-            "message": result.message
-        })
-        return result
+        return result, None
     result.metadata = _read_project_metadata(project_path)
 
     project = None
@@ -2262,33 +3545,116 @@ def delete_project(project_dir_name: str) -> DeletionResult:
     else:
         message_parts.append("Project files not found.")
 
+    return result, message_parts
+
+
+def _finish_project_deletion(
+    result: DeletionResult,
+    message_parts: Optional[List[str]],
+    db_error: Optional[Exception] = None
+) -> Dict[str, Any]:
+    """
+    Record the database cleanup outcome on a result and build its deletion log entry.
+    
+    Args:
+        result: Result returned by _trash_project_files
+        message_parts: Message parts returned by _trash_project_files
+        db_error: Exception raised while deleting the database row, if any
+        
+    Returns:
+        Entry for the deletion log
+    """
+    if message_parts is None:
+        return {
+            "action": "delete",
+            "project_dir": result.project_dir,
+            "message": result.message
+        }
+
     # Clean up database entry when available
     if result.project_id is not None:
-        try:
-            db_manager.delete_project(result.project_id)
+        if db_error is None:
             result.db_deleted = True
             message_parts.append("Database entry removed.")
-        except Exception as e:
-            message_parts.append(f"Database cleanup failed: {e}")
-            logger.error(f"Failed to delete project {project_dir_name} from database: {e}")
+        else:
+            message_parts.append(f"Database cleanup failed: {db_error}")
+            logger.error(f"Failed to delete project {result.project_dir} from database: {db_error}")
     else:
         message_parts.append("No database entry to remove.")
 
     result.success = result.disk_removed or result.db_deleted
     result.message = " ".join(message_parts).strip()
 
-    _append_deletion_log({
+    return {
         "action": "delete",
-        "project_dir": project_dir_name,
+        "project_dir": result.project_dir,
         "disk_removed": result.disk_removed,
         "db_removed": result.db_deleted,
         "trash_path": str(result.trash_path) if result.trash_path else None,
         "message": result.message
-    })
+    }
+
 
+def delete_project(project_dir_name: str) -> DeletionResult:
+    """
+    Delete a project directory, remove its database entry, and log the action.
+    
+    Args:
+        project_dir_name: Name of project directory to delete
+        
+    Returns:
+        DeletionResult describing the outcome.
+    """
+    result, message_parts = _trash_project_files(project_dir_name)
+
+    db_error = None
+    if message_parts is not None and result.project_id is not None:
+        try:
+            db_manager.delete_project(result.project_id)
+        except Exception as e:
+            db_error = e
+
+    _append_deletion_log(_finish_project_deletion(result, message_parts, db_error))
     return result
 
 
+def delete_projects(project_dir_names: List[str]) -> List[DeletionResult]:
+    """
+    Delete several projects at once.
+    
+    Project files are moved to trash concurrently, every database row is
+    removed in one transaction, and the deletion log is written in one pass.
+    
+    Args:
+        project_dir_names: Names of project directories to delete
+        
+    Returns:
+        One DeletionResult per directory, in input order.
+    """
+    if not project_dir_names:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(8, len(project_dir_names))) as executor:
+        staged = list(executor.map(_trash_project_files, project_dir_names))
+
+    project_ids = [
+        result.project_id for result, message_parts in staged
+        if message_parts is not None and result.project_id is not None
+    ]
+    db_error = None
+    if project_ids:
+        try:
+            db_manager.delete_projects(project_ids)
+        except Exception as e:
+            db_error = e
+
+    _append_deletion_log_entries([
+        _finish_project_deletion(result, message_parts, db_error)
+        for result, message_parts in staged
+    ])
+    return [result for result, _ in staged]
+
+
 def restore_project_from_trash(tombstone: Dict[str, Any]) -> Tuple[bool, str]:
     trash_path_str = tombstone.get("trash_path") or ""
     project_dir = tombstone.get("project_dir")
@@ -2376,9 +3742,74 @@ def restore_project_from_trash(tombstone: Dict[str, Any]) -> Tuple[bool, str]:
     return True, "Project restored successfully."
 
 
+def _fetch_youtube_title(url: str) -> str:
+    """
+    Fetch a video's title from YouTube with yt-dlp (no download).
+    
+    Args:
+        url: YouTube video URL
+        
+    Returns:
+        Video title, or "Unknown Video" if yt-dlp reports none
+    """
+    import yt_dlp
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'skip_download': True,
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+        return info.get('title', 'Unknown Video')
+
+
+def _refresh_youtube_title(video_id: str, url: str) -> None:
+    """Re-fetch a stale cached title; failures keep the stale entry."""
+    try:
+        db_manager.put_yt_title_cache(video_id, _fetch_youtube_title(url))
+    except Exception as e:
+        logger.warning(f"Background title refresh failed for {sanitize_url_for_log(url)}: {e}")
+
+
+def get_youtube_title(url: str) -> str:
+    """
+    Get a video's title, served from the SQLite title cache when possible.
+    
+    Fresh entries are returned directly. Stale entries are returned as-is
+    while a refresh runs in the background, so repeat lookups never wait on
+    the network. Only a cache miss fetches synchronously.
+    
+    Args:
+        url: YouTube video URL
+        
+    Returns:
+        Video title
+        
+    Raises:
+        Exception: Whatever yt-dlp raises when a synchronous fetch fails
+    """
+    video_id = extract_video_id(url)
+    if not video_id:
+        return _fetch_youtube_title(url)
+    
+    cached = db_manager.get_yt_title_cache(video_id)
+    if cached is not None:
+        title, fetched_at = cached
+        if time.time() - fetched_at > config.yt_title_cache_max_age_days * 86400:
+            _get_title_update_executor().submit(_refresh_youtube_title, video_id, url)
+        return title
+    
+    title = _fetch_youtube_title(url)
+    db_manager.put_yt_title_cache(video_id, title)
+    return title
+
+
 def update_project_metadata_with_title(project_dir_name: str) -> bool:
     """
-    Update project metadata to include titles if missing.
+    Update project metadata to include titles if missing, and mirror them into the database.
+    
+    Safe to run on a background worker: the database is updated here rather
+    than by the session that started the update.
     
     Args:
         project_dir_name: Name of project directory to update
@@ -2386,6 +3817,48 @@ def update_project_metadata_with_title(project_dir_name: str) -> bool:
     Returns:
         True if update succeeded, False otherwise
     """
+    title_row = _update_metadata_titles(project_dir_name)
+    if title_row is None:
+        return False
+    return _sync_project_titles_to_db([title_row])
+
+
+def _sync_project_titles_to_db(title_rows: List[Tuple[Optional[str], Optional[str], str]]) -> bool:
+    """
+    Mirror regenerated titles into the projects table in one transaction.
+    
+    Keeps the sidebar's needs-update check (answered from the database) in
+    step with metadata.json. Failures are logged; metadata stays updated and
+    the next title update retries the sync.
+    
+    Args:
+        title_rows: (title, content_title, project_dir) rows from _update_metadata_titles
+        
+    Returns:
+        True if the rows were written (or there were none)
+    """
+    if not title_rows:
+        return True
+    try:
+        db_manager.update_project_titles(title_rows)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to sync {len(title_rows)} project title(s) to database: {e}")
+        return False
+
+
+def _update_metadata_titles(project_dir_name: str) -> Optional[Tuple[Optional[str], Optional[str], str]]:
+    """
+    Fill in missing titles in a project's metadata.json.
+    
+    Args:
+        project_dir_name: Name of project directory to update
+        
+    Returns:
+        (title, content_title, project_dir) for the database if the metadata
+        has any title (newly generated or already present, so a database row
+        missed by an earlier sync catches up), otherwise None
+    """
     # Validate and sanitize directory name
     is_valid, project_path, error_msg = validate_and_sanitize_path(
         project_dir_name,
@@ -2395,33 +3868,24 @@ def update_project_metadata_with_title(project_dir_name: str) -> bool:
     
     if not is_valid:
         logger.warning(f"Invalid project directory name for update: {project_dir_name} - {error_msg}")
-        return False
+        return None
     metadata_file = project_path / "metadata.json"
     
     if not metadata_file.exists():
-        return False
+        return None
     
     try:
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+        metadata = orjson.loads(metadata_file.read_bytes())
         
         updated = False
         
         # For YouTube videos: fetch video title if missing
         if 'url' in metadata and 'title' not in metadata:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'skip_download': True,
-            }
-            
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(metadata['url'], download=False)
-                    video_title = info.get('title', 'Unknown Video')
-                    metadata['title'] = video_title
-                    updated = True
-                    logger.info(f"Updated YouTube title for {project_dir_name}: {video_title}")
+                video_title = get_youtube_title(metadata['url'])
+                metadata['title'] = video_title
+                updated = True
+                logger.info(f"Updated YouTube title for {project_dir_name}: {video_title}")
             except Exception as e:
                 logger.warning(f"Failed to fetch YouTube title for {project_dir_name}: {e}")
         
@@ -2436,12 +3900,10 @@ def update_project_metadata_with_title(project_dir_name: str) -> bool:
             
             # Only read the first TITLE_SAMPLE_SIZE characters to save memory
             if transcript_file.exists():
-                with open(transcript_file, 'r', encoding='utf-8') as f:
-                    text_content = f.read(config.title_sample_size)
+                text_content = read_text_prefix(transcript_file, config.title_sample_size)
                 title_key = 'transcript_title'
             elif extracted_text_file.exists():
-                with open(extracted_text_file, 'r', encoding='utf-8') as f:
-                    text_content = f.read(config.title_sample_size)
+                text_content = read_text_prefix(extracted_text_file, config.title_sample_size)
                 title_key = 'content_title'
             
             if text_content and text_content.strip() and title_key:
@@ -2455,17 +3917,36 @@ def update_project_metadata_with_title(project_dir_name: str) -> bool:
         
         if updated:
             # Save updated metadata
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=4)
-            return True
-        
-        return False
-    except (json.JSONDecodeError, IOError) as e:
+            metadata_file.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        
+        title = metadata.get('title')
+        content_title = metadata.get('transcript_title') or metadata.get('content_title')
+        if title or content_title:
+            return (title, content_title, project_dir_name)
+        return None
+    except (orjson.JSONDecodeError, IOError) as e:
         logger.error(f"Failed to update metadata for {project_dir_name}: {e}")
-        return False
+        return None
     except Exception as e:
         logger.error(f"Unexpected error updating metadata for {project_dir_name}: {e}")
-        return False
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def _get_title_update_executor() -> ThreadPoolExecutor:
+    """
+    Thread pool for background project title updates, shared across reruns.
+    
+    Title updates are dominated by yt-dlp and GPT network round-trips, so
+    running them here keeps the sidebar responsive while they overlap.
+    
+    Returns:
+        Process-wide ThreadPoolExecutor
+    """
+    return ThreadPoolExecutor(
+        max_workers=max(1, config.title_update_max_workers),
+        thread_name_prefix="title-update"
+    )
 
 
 # -----------------------------
@@ -2581,31 +4062,40 @@ with st.sidebar:
     # Quick search in sidebar
     search_query = st.text_input("🔍 Quick search", placeholder="Search projects...", key="sidebar_search")
 
-    projects = []
-    try:
-        if search_query:
-            db_projects = db_manager.list_projects(search_query=search_query, limit=20)
-        else:
-            db_projects = db_manager.list_projects(limit=20, order_by="created_at", order_desc=True)
-
-        for p in db_projects:
-            source = str(p.source) if p.source else ''
-            proj_dict = {
-                'project_dir': p.project_dir,
-                'id': p.id,
-                'title': p.title or '',
-                'transcript_title': p.content_title if p.type == 'youtube' else None,
-                'content_title': p.content_title if p.type == 'document' else None,
-                'url': source if p.type == 'youtube' else None,
-                'filename': source if p.type == 'document' else None,
-                'timestamp': p.created_at or '',
-                'word_count': p.word_count or 0,
-                'tags': list(p.tags) if p.tags else []
-            }
-            projects.append(proj_dict)
-    except Exception as e:
-        logger.error(f"Failed to load projects from database: {e}")
-        projects = list_projects()
+    # Reuse this session's last listing until a project/tag write happens
+    projects_cache_key = (db_manager.write_version, search_query)
+    projects_cache = st.session_state.get('projects_cache')
+    projects_from_db = True
+    if projects_cache and projects_cache[0] == projects_cache_key:
+        projects = projects_cache[1]
+    else:
+        projects = []
+        try:
+            if search_query:
+                db_projects = db_manager.list_projects(search_query=search_query, limit=20)
+            else:
+                db_projects = db_manager.list_projects(limit=20, order_by="created_at", order_desc=True)
+
+            for p in db_projects:
+                source = str(p.source) if p.source else ''
+                proj_dict = {
+                    'project_dir': p.project_dir,
+                    'id': p.id,
+                    'title': p.title or '',
+                    'transcript_title': p.content_title if p.type == 'youtube' else None,
+                    'content_title': p.content_title if p.type == 'document' else None,
+                    'url': source if p.type == 'youtube' else None,
+                    'filename': source if p.type == 'document' else None,
+                    'timestamp': p.created_at or '',
+                    'word_count': p.word_count or 0,
+                    'tags': list(p.tags) if p.tags else []
+                }
+                projects.append(proj_dict)
+            st.session_state['projects_cache'] = (projects_cache_key, projects)
+        except Exception as e:
+            logger.error(f"Failed to load projects from database: {e}")
+            projects = list_projects()
+            projects_from_db = False
 
     sidebar_query_projects = [p for p in projects if p.get('id')]
 
@@ -2623,10 +4113,10 @@ with st.sidebar:
 
     st.markdown("### Sidebar Transcript Query")
     if sidebar_query_projects:
-        project_labels = {
-            proj['id']: _sidebar_project_label(proj)
-            for proj in sidebar_query_projects
-        }
+        for proj in sidebar_query_projects:
+            if '_sidebar_label' not in proj:
+                proj['_sidebar_label'] = _sidebar_project_label(proj)
+        project_labels = {proj['id']: proj['_sidebar_label'] for proj in sidebar_query_projects}
         selected_project_id = st.selectbox(
             "Select project for transcript query",
             options=list(project_labels.keys()),
@@ -2818,284 +4308,271 @@ with st.sidebar:
     if projects:
         st.write(f"**Total projects:** {len(projects)}")
         
-        # Add a button to update old projects with titles
-        needs_update = any(
-            ('url' in p and 'title' not in p) or 
-            ('transcript_title' not in p and 'content_title' not in p)
-            for p in projects
-        )
-        if needs_update:
+        # Add a button to update old projects with titles. The database answers
+        # this for every project (including unlisted ones) from a partial index;
+        # only the metadata fallback scans the listed projects in Python.
+        if projects_from_db:
+            dirs_needing_titles = db_manager.list_project_dirs_needing_titles()
+        else:
+            dirs_needing_titles = [
+                p['project_dir'] for p in projects
+                if ('url' in p and 'title' not in p) or
+                ('transcript_title' not in p and 'content_title' not in p)
+            ]
+        title_update_futures = st.session_state.get('title_update_futures')
+        if title_update_futures:
+            done_count = sum(1 for future in title_update_futures if future.done())
+            if done_count < len(title_update_futures):
+                st.progress(
+                    done_count / len(title_update_futures),
+                    text=f"Updating project titles... {done_count}/{len(title_update_futures)}"
+                )
+                if st.button("🔄 Refresh progress", key="title_update_refresh", use_container_width=True):
+                    st.rerun()
+            else:
+                st.session_state.pop('title_update_futures', None)
+                # Workers already wrote the database; only count their outcomes
+                updated_count = sum(1 for future in title_update_futures if future.result())
+                if updated_count > 0:
+                    st.success(f"✅ Updated {updated_count} project(s)!")
+                else:
+                    st.info("No project titles could be filled in.")
+        elif dirs_needing_titles:
             if st.button("🔄 Update Old Projects", help="Generate titles from content for old projects", use_container_width=True):
-                with st.spinner("Updating project titles..."):
-                    updated_count = 0
-                    for proj in projects:
-                        if update_project_metadata_with_title(proj['project_dir']):
-                            updated_count += 1
-                    if updated_count > 0:
-                        st.success(f"✅ Updated {updated_count} project(s)!")
-                        st.rerun()
-                    else:
-                        st.info("No projects needed updating.")
+                executor = _get_title_update_executor()
+                st.session_state['title_update_futures'] = [
+                    executor.submit(update_project_metadata_with_title, project_dir)
+                    for project_dir in dirs_needing_titles
+                ]
+                st.rerun()
         
         st.markdown("---")
         
+        # Projects awaiting delete confirmation, tracked in one set rather
+        # than a session-state flag per project
+        pending_delete = st.session_state.setdefault('pending_delete', set())
+        
         for idx, proj in enumerate(projects):
-            # Create a meaningful title for the project
-            if 'url' in proj:
-                # For YouTube videos, prioritize transcript_title, then title
-                project_icon = "🎥"
-                
-                # Use transcript-based title if available, otherwise YouTube title
-                if 'transcript_title' in proj and proj['transcript_title']:
-                    title = proj['transcript_title']
-                elif 'title' in proj and proj['title']:
-                    title = proj['title']
-                else:
-                    title = None
-                
-                if title:
-                    # Truncate if too long
-                    project_name = truncate_title(title)
-                else:
-                    # Fallback to video ID extraction
-                    if proj.get('url'):
-                        vid_id = extract_video_id(str(proj['url']))
-                        if vid_id:
-                            # Determine if it's a short or regular video
-                            if '/shorts/' in str(proj['url']):
-                                project_name = f"Short {vid_id[:11]}"
-                            else:
-                                project_name = f"Video {vid_id[:11]}"
-                        else:
-                            project_name = f"Video {idx + 1}"
-                    else:
-                        project_name = f"Video {idx + 1}"
-            elif 'filename' in proj:
-                # For documents, use content_title if available, otherwise filename
-                project_icon = "📄"
-                
-                if 'content_title' in proj and proj['content_title']:
-                    project_name = truncate_title(proj['content_title'])
-                else:
-                    project_name = truncate_title(proj['filename'])
-            else:
-                project_icon = "📄"
-                project_name = f"Project {idx + 1}"
+            # Titles only change when the listing is rebuilt, so derive them once
+            # per cached listing entry instead of on every rerun
+            if '_display' not in proj:
+                proj['_display'] = _project_display_name(proj, idx)
+            project_icon, project_name = proj['_display']
             
             with st.expander(f"{project_icon} {project_name}", expanded=False):
-                # Display project info
-                if 'url' in proj and proj['url']:
-                    st.write("**Type:** YouTube Video")
-                    if 'transcript_title' in proj and proj['transcript_title']:
-                        st.write(f"**Content Title:** {proj['transcript_title']}")
-                    if 'title' in proj and proj['title']:
-                        st.write(f"**Video Title:** {proj['title']}")
-                    st.write(f"**URL:** {format_url_for_display(proj['url'])}")
-                elif 'filename' in proj and proj['filename']:
-                    st.write("**Type:** Document")
-                    if 'content_title' in proj and proj['content_title']:
-                        st.write(f"**Content Title:** {proj['content_title']}")
-                    st.write(f"**File:** {proj['filename']}")
-                
-                # Format timestamp nicely
-                try:
-                    dt = datetime.fromisoformat(proj['timestamp'])
-                    formatted_date = dt.strftime("%b %d, %Y %I:%M %p")
-                    st.write(f"**Date:** {formatted_date}")
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Failed to format timestamp for project {proj.get('project_dir', 'unknown')}: {e}")
-                    st.write(f"**Date:** {proj.get('timestamp', 'Unknown')[:19]}")
-                
-                st.write(f"**Words:** {proj.get('word_count', 'N/A'):,}")
+                # Display project info as a single markdown element
+                if '_info_md' not in proj:
+                    proj['_info_md'] = _project_info_markdown(proj)
+                st.markdown(proj['_info_md'])
                 
-                project_content = {'transcript': '', 'summary': '', 'key_factors': ''}
-                transcript_text = ""
-                project_summary = ""
-                key_factors_text = ""
                 project_dir_safe = safe_filename(proj.get('project_dir') or f"project_{idx}")
-                if proj.get('id'):
-                    try:
-                        project_content = db_manager.get_project_content(proj['id'])
-                    except ProjectNotFoundError:
-                        st.warning("Project record missing; transcript chat unavailable.")
-                    except Exception as exc:
-                        logger.error(f"Failed to load content for {proj.get('project_dir')}: {exc}")
-                        st.warning("Unable to load transcript content for this project.")
-                project_summary = project_content.get('summary', '') or ''
-                key_factors_text = project_content.get('key_factors', '') or ''
-                transcript_text = project_content.get('transcript', '') or ''
-
-                if project_summary:
-                    st.markdown("**Summary**")
-                    st.text_area(
-                        f"Summary for {project_name}",
-                        value=project_summary,
-                        height=120,
-                        key=f"summary_{project_dir_safe}_readonly",
-                        label_visibility="collapsed",
-                        disabled=True
-                    )
-                else:
-                    st.info("Summary not available for this project yet.")
-
-                if key_factors_text:
-                    st.markdown("**Key Factors**")
-                    st.text_area(
-                        f"Key factors for {project_name}",
-                        value=key_factors_text,
-                        height=140,
-                        key=f"key_factors_{project_dir_safe}_readonly",
-                        label_visibility="collapsed",
-                        disabled=True
-                    )
-                else:
-                    st.info("Key factors not available for this project yet.")
-
-                project_chat_key = str(proj.get('id') or safe_filename(proj['project_dir']))
-                question_key = f"project_chat_question_{project_chat_key}"
-                response_key = f"project_chat_response_{project_chat_key}"
-                transcript_context = transcript_text.strip() or project_summary.strip() or key_factors_text.strip()
-                st.markdown("---")
-                st.write("**Chat with this transcript**")
-                if not transcript_context:
-                    st.warning("Transcript content is not ready yet. Please process the project fully first.")
-                question = st.text_input(
-                    "Ask a question about this project:",
-                    key=question_key,
-                    placeholder="e.g., What are the main takeaways?",
-                    help="Answers are generated by the transcript/summary/key factors.",
-                    label_visibility="collapsed"
-                )
-                button_disabled = not bool(transcript_context)
-                if st.button("💬 Run transcript chat", key=f"project_chat_btn_{project_chat_key}", disabled=button_disabled):
-                    raw_question = st.session_state.get(question_key, "")
-                    sanitized_question = sanitize_chat_question(raw_question)
-                    
-                    # Check rate limiting
-                    is_allowed, wait_time = check_chat_rate_limit(project_chat_key, min_seconds=2)
-                    if not is_allowed:
-                        st.warning(f"⏳ Please wait {wait_time:.1f} more seconds before asking another question.")
-                    elif len(sanitized_question) < config.qa_min_question_length:
-                        st.warning(f"Please enter at least {config.qa_min_question_length} characters.")
-                    elif len(sanitized_question) > config.qa_max_question_length:
-                        st.warning(f"Please limit questions to {config.qa_max_question_length} characters.")
-                    elif client is None:
-                        st.error("OpenAI API key is not configured; enable it in .env to use transcript chat.")
-                        record_sidebar_operation(
-                            "Transcript Chat",
-                            "failed",
-                            message="Missing OpenAI API key.",
-                            project_dir=proj.get('project_dir')
-                        )
-                    else:
+                # Summary, key factors and chat need the full project content; only
+                # fetch and render them for projects the user asks to open
+                if st.toggle("Show summary & chat", key=f"details_{project_dir_safe}"):
+                    project_content = {'transcript': '', 'summary': '', 'key_factors': ''}
+                    transcript_text = ""
+                    project_summary = ""
+                    key_factors_text = ""
+                    if proj.get('id'):
                         try:
-                            with st.spinner("Generating answer..."):
-                                answer, tokens_used, cached = answer_question_from_transcript(
-                                    sanitized_question,
-                                    transcript_context,
-                                    project_name or proj.get('title') or proj.get('project_dir'),
-                                    summary=project_summary
-                                )
-                            st.session_state[response_key] = {
-                                "answer": answer,
-                                "tokens": tokens_used,
-                                "cached": cached,
-                                "question": sanitized_question,
-                                "timestamp": datetime.now().isoformat()
-                            }
-                            record_sidebar_operation(
-                                "Transcript Chat",
-                                "success",
-                                message=f"{sanitized_question[:70]}",
-                                project_dir=proj.get('project_dir')
-                            )
+                            project_content = db_manager.get_project_content(proj['id'])
+                        except ProjectNotFoundError:
+                            st.warning("Project record missing; transcript chat unavailable.")
                         except Exception as exc:
-                            logger.exception("Transcript chat failed", exc_info=exc)
-                            st.error("Unable to generate an answer right now. Please try again.")
+                            logger.error(f"Failed to load content for {proj.get('project_dir')}: {exc}")
+                            st.warning("Unable to load transcript content for this project.")
+                    project_summary = project_content.get('summary', '') or ''
+                    key_factors_text = project_content.get('key_factors', '') or ''
+                    transcript_text = project_content.get('transcript', '') or ''
+
+                    if project_summary:
+                        st.markdown("**Summary**")
+                        st.text_area(
+                            f"Summary for {project_name}",
+                            value=project_summary,
+                            height=120,
+                            key=f"summary_{project_dir_safe}_readonly",
+                            label_visibility="collapsed",
+                            disabled=True
+                        )
+                    else:
+                        st.info("Summary not available for this project yet.")
+
+                    if key_factors_text:
+                        st.markdown("**Key Factors**")
+                        st.text_area(
+                            f"Key factors for {project_name}",
+                            value=key_factors_text,
+                            height=140,
+                            key=f"key_factors_{project_dir_safe}_readonly",
+                            label_visibility="collapsed",
+                            disabled=True
+                        )
+                    else:
+                        st.info("Key factors not available for this project yet.")
+
+                    project_chat_key = str(proj.get('id') or safe_filename(proj['project_dir']))
+                    question_key = f"project_chat_question_{project_chat_key}"
+                    response_key = f"project_chat_response_{project_chat_key}"
+                    transcript_context = transcript_text.strip() or project_summary.strip() or key_factors_text.strip()
+                    st.markdown("---")
+                    st.write("**Chat with this transcript**")
+                    if not transcript_context:
+                        st.warning("Transcript content is not ready yet. Please process the project fully first.")
+                    question = st.text_input(
+                        "Ask a question about this project:",
+                        key=question_key,
+                        placeholder="e.g., What are the main takeaways?",
+                        help="Answers are generated by the transcript/summary/key factors.",
+                        label_visibility="collapsed"
+                    )
+                    button_disabled = not bool(transcript_context)
+                    if st.button("💬 Run transcript chat", key=f"project_chat_btn_{project_chat_key}", disabled=button_disabled):
+                        raw_question = st.session_state.get(question_key, "")
+                        sanitized_question = sanitize_chat_question(raw_question)
+                    
+                        # Check rate limiting
+                        is_allowed, wait_time = check_chat_rate_limit(project_chat_key, min_seconds=2)
+                        if not is_allowed:
+                            st.warning(f"⏳ Please wait {wait_time:.1f} more seconds before asking another question.")
+                        elif len(sanitized_question) < config.qa_min_question_length:
+                            st.warning(f"Please enter at least {config.qa_min_question_length} characters.")
+                        elif len(sanitized_question) > config.qa_max_question_length:
+                            st.warning(f"Please limit questions to {config.qa_max_question_length} characters.")
+                        elif client is None:
+                            st.error("OpenAI API key is not configured; enable it in .env to use transcript chat.")
                             record_sidebar_operation(
                                 "Transcript Chat",
                                 "failed",
-                                message=str(exc),
+                                message="Missing OpenAI API key.",
                                 project_dir=proj.get('project_dir')
                             )
-
-                response = st.session_state.get(response_key)
-                if response:
-                    st.markdown("**Latest answer**")
-                    st.write(response.get("answer"))
-                    meta_parts = []
-                    if response.get("tokens") is not None:
-                        meta_parts.append(f"Tokens used: {response['tokens']}")
-                    if response.get("cached"):
-                        meta_parts.append("From cache")
-                    if response.get("timestamp"):
-                        meta_parts.append(f"Answered: {response['timestamp']}")
-                    if meta_parts:
-                        st.caption(" · ".join(meta_parts))
-                st.markdown("---")
-
-                # Delete button with confirmation
-                col1, col2 = st.columns([1, 1])
-                with col1:
-                    delete_key = f"del_{proj['project_dir']}"
-                    if delete_key not in st.session_state:
-                        st.session_state[delete_key] = False
-                    
-                    if not st.session_state[delete_key]:
-                        if st.button("🗑️ Delete", key=f"btn_{delete_key}", use_container_width=True):
-                            st.session_state[delete_key] = True
-                            st.rerun()
-                    else:
-                        if st.button("✅ Confirm", key=f"conf_{delete_key}", type="primary", use_container_width=True):
-                            deletion_result = delete_project(proj['project_dir'])
-                            if deletion_result.success:
-                                st.success(deletion_result.message or "Deleted!")
+                        else:
+                            try:
+                                with st.spinner("Generating answer..."):
+                                    answer, tokens_used, cached = answer_question_from_transcript(
+                                        sanitized_question,
+                                        transcript_context,
+                                        project_name or proj.get('title') or proj.get('project_dir'),
+                                        summary=project_summary
+                                    )
+                                st.session_state[response_key] = {
+                                    "answer": answer,
+                                    "tokens": tokens_used,
+                                    "cached": cached,
+                                    "question": sanitized_question,
+                                    "timestamp": datetime.now().isoformat()
+                                }
                                 record_sidebar_operation(
-                                    "Delete Project",
+                                    "Transcript Chat",
                                     "success",
-                                    message=deletion_result.message or "Deleted project.",
-                                    project_dir=proj['project_dir']
+                                    message=f"{sanitized_question[:70]}",
+                                    project_dir=proj.get('project_dir')
                                 )
-                                st.session_state["last_deleted_project"] = {
-                                    "project_dir": proj['project_dir'],
-                                    "title": deletion_result.metadata.get("title") or proj.get("title") or proj['project_dir'],
-                                    "trash_path": str(deletion_result.trash_path) if deletion_result.trash_path else "",
-                                    "deleted_at": datetime.now().isoformat(),
-                                    "message": deletion_result.message,
-                                    "disk_removed": deletion_result.disk_removed,
-                                    "db_removed": deletion_result.db_deleted
-                                }
-                            else:
-                                st.error(deletion_result.message or "Failed to delete project.")
+                            except Exception as exc:
+                                logger.exception("Transcript chat failed", exc_info=exc)
+                                st.error("Unable to generate an answer right now. Please try again.")
                                 record_sidebar_operation(
-                                    "Delete Project",
+                                    "Transcript Chat",
                                     "failed",
-                                    message=deletion_result.message or "Delete project failed.",
-                                    project_dir=proj['project_dir']
+                                    message=str(exc),
+                                    project_dir=proj.get('project_dir')
                                 )
-                            st.session_state[delete_key] = False
-                            st.rerun()
-                
-                with col2:
-                    if st.session_state.get(delete_key, False):
-                        if st.button("❌ Cancel", key=f"canc_{delete_key}", use_container_width=True):
-                            st.session_state[delete_key] = False
-                            st.rerun()
+
+                    response = st.session_state.get(response_key)
+                    if response:
+                        st.markdown("**Latest answer**")
+                        st.write(response.get("answer"))
+                        meta_parts = []
+                        if response.get("tokens") is not None:
+                            meta_parts.append(f"Tokens used: {response['tokens']}")
+                        if response.get("cached"):
+                            meta_parts.append("From cache")
+                        if response.get("timestamp"):
+                            meta_parts.append(f"Answered: {response['timestamp']}")
+                        if meta_parts:
+                            st.caption(" · ".join(meta_parts))
+                st.markdown("---")
+
+                # Delete button with confirmation
+                delete_key = f"del_{proj['project_dir']}"
+
+                # Pure state toggles use callbacks: they run before the click's own rerun,
+                # so no extra st.rerun() is needed to show the new state
+                if proj['project_dir'] not in pending_delete:
+                    st.button(
+                        "🗑️ Delete", key=f"btn_{delete_key}", use_container_width=True,
+                        on_click=_set_pending_delete, args=(proj['project_dir'], True)
+                    )
+                else:
+                    # Confirm/Cancel live in one form so the choice is submitted in a single rerun
+                    with st.form(key=f"del_form_{delete_key}"):
+                        col1, col2 = st.columns([1, 1])
+                        with col1:
+                            confirm_delete = st.form_submit_button(
+                                "✅ Confirm", type="primary", use_container_width=True
+                            )
+                        with col2:
+                            st.form_submit_button(
+                                "❌ Cancel", use_container_width=True,
+                                on_click=_set_pending_delete, args=(proj['project_dir'], False)
+                            )
+
+                    if confirm_delete:
+                        deletion_result = delete_project(proj['project_dir'])
+                        if deletion_result.success:
+                            st.success(deletion_result.message or "Deleted!")
+                            record_sidebar_operation(
+                                "Delete Project",
+                                "success",
+                                message=deletion_result.message or "Deleted project.",
+                                project_dir=proj['project_dir']
+                            )
+                            st.session_state["last_deleted_project"] = {
+                                "project_dir": proj['project_dir'],
+                                "title": deletion_result.metadata.get("title") or proj.get("title") or proj['project_dir'],
+                                "trash_path": str(deletion_result.trash_path) if deletion_result.trash_path else "",
+                                "deleted_at": datetime.now().isoformat(),
+                                "message": deletion_result.message,
+                                "disk_removed": deletion_result.disk_removed,
+                                "db_removed": deletion_result.db_deleted
+                            }
+                        else:
+                            st.error(deletion_result.message or "Failed to delete project.")
+                            record_sidebar_operation(
+                                "Delete Project",
+                                "failed",
+                                message=deletion_result.message or "Delete project failed.",
+                                project_dir=proj['project_dir']
+                            )
+                        pending_delete.discard(proj['project_dir'])
+                        st.rerun()
         
         # Bulk delete option
         st.markdown("---")
-        if st.button("🗑️ Delete All Projects", type="secondary", use_container_width=True):
-            confirm_all_key = "confirm_delete_all"
-            if confirm_all_key not in st.session_state:
-                st.session_state[confirm_all_key] = True
-                st.warning("⚠️ Click again to confirm deletion of ALL projects!")
-                st.rerun()
-            else:
-                deleted_count = 0
-                for proj in projects:
-                    result = delete_project(proj['project_dir'])
-                    if result.success:
-                        deleted_count += 1
+        confirm_all_key = "confirm_delete_all"
+        if not st.session_state.get(confirm_all_key, False):
+            st.button(
+                "🗑️ Delete All Projects", type="secondary", use_container_width=True,
+                on_click=_set_session_flag, args=(confirm_all_key, True)
+            )
+        else:
+            with st.form(key="delete_all_form"):
+                st.warning("⚠️ Confirm deletion of ALL projects!")
+                col1, col2 = st.columns([1, 1])
+                with col1:
+                    confirm_delete_all = st.form_submit_button(
+                        "✅ Confirm", type="primary", use_container_width=True
+                    )
+                with col2:
+                    st.form_submit_button(
+                        "❌ Cancel", use_container_width=True,
+                        on_click=_set_session_flag, args=(confirm_all_key, False)
+                    )
+
+            if confirm_delete_all:
+                deletion_results = delete_projects([proj['project_dir'] for proj in projects])
+                deleted_count = sum(1 for result in deletion_results if result.success)
                 st.success(f"Deleted {deleted_count} project(s)!")
                 record_sidebar_operation(
                     "Delete All Projects",
@@ -3128,9 +4605,11 @@ if st.session_state.show_help:
             try:
                 user_guide_path = Path(__file__).parent / "USER_GUIDE.md"
                 if user_guide_path.exists():
-                    with open(user_guide_path, 'r', encoding='utf-8') as f:
-                        user_guide_content = f.read()
-                    st.markdown(user_guide_content)
+                    guide_blocks = _load_user_guide_blocks(
+                        str(user_guide_path), user_guide_path.stat().st_mtime
+                    )
+                    for block in guide_blocks:
+                        st.markdown(block)
                 else:
                     st.error("User guide file not found. Please check USER_GUIDE.md exists.")
             except Exception as e:
@@ -3143,6 +4622,136 @@ if st.session_state.show_help:
     
     st.stop()  # Don't show main content when help is displayed
 
+# -----------------------------
+# ERROR GUIDANCE
+# -----------------------------
+# User-facing suggestions shown next to processing errors
+_DOWNLOAD_HINTS = (
+    "**Suggestions:**\n"
+    "- Verify the video is public and available\n"
+    "- Check if the video is available in your region\n"
+    "- Try a different video URL"
+)
+_AUDIO_SIZE_HINTS = (
+    "**Suggestions:**\n"
+    "- Try a shorter video (under 30 minutes)\n"
+    "- Lower the audio quality in your .env file (AUDIO_QUALITY=64)\n"
+    "- The Whisper API has a 25MB file size limit"
+)
+_TRANSCRIPTION_HINTS = (
+    "**Suggestions:**\n"
+    "- Check that your OpenAI API key is valid\n"
+    "- Ensure you have API credits available\n"
+    "- Visit: https://platform.openai.com/usage"
+)
+_QUOTA_HINTS = (
+    "**What to do:**\n"
+    "1. Check your OpenAI usage dashboard\n"
+    "2. Add credits or upgrade your plan\n"
+    "3. Wait for your rate limit to reset\n"
+    "4. Visit: https://platform.openai.com/usage"
+)
+_CONNECTION_HINTS = (
+    "**Suggestions:**\n"
+    "- Check your internet connection\n"
+    "- Verify OpenAI services are operational\n"
+    "- Check: https://status.openai.com/\n"
+    "- Try again in a few moments"
+)
+_VIDEO_TROUBLESHOOTING_HINTS = (
+    "**Troubleshooting:**\n"
+    "- Check the app.log file for details\n"
+    "- Verify all dependencies are installed\n"
+    "- Ensure FFmpeg is installed and in PATH\n"
+    "- Try restarting the application"
+)
+_UPLOAD_SIZE_HINTS = (
+    "**Suggestions:**\n"
+    "- Split large documents into smaller files\n"
+    "- Remove unnecessary images or formatting\n"
+    "- Convert to plain text format"
+)
+_UPLOAD_VALIDATION_HINTS = (
+    "**Suggestions:**\n"
+    "- Ensure the file is a valid PDF, DOCX, or TXT file\n"
+    "- Check that the file is not corrupted\n"
+    "- Verify the file extension matches the actual file type\n"
+    "- Avoid special characters in the filename"
+)
+_DOCUMENT_HINTS = (
+    "**Suggestions:**\n"
+    "- Ensure the document is not corrupted\n"
+    "- Try converting to a different format (PDF, DOCX, or TXT)\n"
+    "- Check that the file contains readable text\n"
+    "- Verify the file is not password-protected"
+)
+_DOCUMENT_TROUBLESHOOTING_HINTS = (
+    "**Troubleshooting:**\n"
+    "- Check the app.log file for details\n"
+    "- Verify all dependencies are installed (pypdfium2, python-docx)\n"
+    "- Ensure the document format is supported\n"
+    "- Try restarting the application"
+)
+_IN_PROGRESS_HINTS = (
+    "**Suggestions:**\n"
+    "- Wait for the other run to finish, then submit again to see its results\n"
+    "- If a previous run stopped partway, tick \"Reprocess\" to start over"
+)
+
+# Per-exception feedback: (heading, suggestions, suggestion level, log label)
+_VIDEO_ERRORS = {
+    AudioDownloadError: ("Download Failed", _DOWNLOAD_HINTS, "info", "Audio download error"),
+    FileSizeError: ("File Too Large", _AUDIO_SIZE_HINTS, "info", "File size error"),
+    TranscriptionError: ("Transcription Failed", _TRANSCRIPTION_HINTS, "info", "Transcription error"),
+    APIQuotaError: ("API Quota Exceeded", _QUOTA_HINTS, "warning", "API quota error"),
+    APIConnectionError: ("Connection Failed", _CONNECTION_HINTS, "info", "API connection error"),
+    ProjectInProgressError: ("Already Processing", _IN_PROGRESS_HINTS, "info", "Duplicate submission"),
+}
+_VIDEO_UNEXPECTED_ERROR = ("Unexpected Error", _VIDEO_TROUBLESHOOTING_HINTS, "info", "Unexpected error")
+
+_DOCUMENT_ERRORS = {
+    DocumentProcessingError: ("Document Processing Failed", _DOCUMENT_HINTS, "info", "Document processing error"),
+    APIQuotaError: ("API Quota Exceeded", _QUOTA_HINTS, "warning", "API quota error"),
+    APIConnectionError: ("Connection Failed", _CONNECTION_HINTS, "info", "API connection error"),
+    ProjectInProgressError: ("Already Processing", _IN_PROGRESS_HINTS, "info", "Duplicate submission"),
+}
+_DOCUMENT_UNEXPECTED_ERROR = ("Unexpected Error", _DOCUMENT_TROUBLESHOOTING_HINTS, "info", "Unexpected document error")
+
+
+def _report_processing_error(
+    operation: str,
+    error: Exception,
+    error_map: Dict[type, Tuple[str, str, str, str]],
+    unexpected: Tuple[str, str, str, str],
+    details_key: Optional[str] = None
+) -> None:
+    """
+    Show feedback for a failed processing run and record it in the sidebar feed.
+    
+    Args:
+        operation: Operation name for the recent operations feed
+        error: Exception raised while processing
+        error_map: Exception type -> (heading, suggestions, suggestion level, log label)
+        unexpected: Feedback used when the exception type is not in error_map
+        details_key: Widget key for the "Show technical details" checkbox
+    """
+    error_type = error.__class__
+    record_sidebar_operation(
+        operation,
+        "failed",
+        message=f"{error_type.__name__}: {error}"
+    )
+    feedback = next((error_map[cls] for cls in error_type.__mro__ if cls in error_map), None)
+    heading, hints, hint_level, log_label = feedback or unexpected
+    
+    st.error(f"❌ **{heading}**")
+    st.error(str(error))
+    getattr(st, hint_level)(hints)
+    logger.error(f"{log_label}: {error}")
+    
+    if feedback is None and st.checkbox("Show technical details", key=details_key):
+        st.exception(error)
+
 # -----------------------------
 # PAGE ROUTING
 # -----------------------------
@@ -3168,10 +4777,15 @@ if mode == "YouTube Video":
     
     # Show info about selected method
     if use_local_gpu:
+        _start_whisper_prewarm(config.whisper_model_size, config.whisper_device, config.whisper_compute_type)
         st.info("🎮 **Using Local GPU (GTX 1080)**: ~5 min for 100-min video, FREE, good accuracy")
     else:
         st.info("☁️ **Using OpenAI API**: ~10 min for 100-min video, ~$0.60, best accuracy")
     
+    reprocess = st.checkbox(
+        "Reprocess",
+        help="Process the video again even if it was already processed with this method (the old results go to trash)"
+    )
     process_button = st.button("Process Video")
     
     if process_button:
@@ -3183,6 +4797,9 @@ if mode == "YouTube Video":
             st.error("Please enter a valid YouTube URL.")
             st.stop()
         
+        # Rate limiting (cheapest check first)
+        _enforce_rate_limit()
+        
         record_sidebar_operation(
             "Process Video",
             "started",
@@ -3195,44 +4812,36 @@ if mode == "YouTube Video":
             logger.warning(f"Invalid YouTube URL attempted: {sanitize_url_for_log(url)}")
             st.stop()
         
-        # Rate limiting
-        if 'last_process_time' not in st.session_state:
-            st.session_state.last_process_time = 0
-        
-        current_time = time.time()
-        time_since_last = current_time - st.session_state.last_process_time
-        if time_since_last < config.rate_limit_seconds:
-            wait_time = config.rate_limit_seconds - time_since_last
-            st.warning(f"⏳ Please wait {wait_time:.1f} more seconds before processing another request.")
-            st.stop()
-        
-        st.session_state.last_process_time = current_time
-
         try:
-            # Create session directory
-            video_id = safe_filename(str(uuid.uuid4()))
+            # Session directory is derived from the URL and transcription method
+            # so resubmits reuse saved work
+            video_id = derive_project_id(url.strip(), _transcription_key(use_local_gpu))
             session_dir = config.output_dir / video_id
-            session_dir.mkdir(exist_ok=True)
-            
-            # Create progress tracking
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            # Callback function to update UI
-            def update_ui(progress: int, message: str):
-                """Update progress bar and status text from processing function."""
-                progress_bar.progress(progress)
-                status_text.text(message)
-            
-            # Call business logic function with progress callback
-            results = process_youtube_video(url, session_dir, progress_callback=update_ui, use_local_gpu=use_local_gpu)
+            results = claim_project_dir(session_dir, reprocess=reprocess)
             
-            # Brief pause to show completion
-            time.sleep(0.5)
-            progress_bar.empty()
-            status_text.empty()
-            
-            st.success("✅ Processing complete!")
+            if results is not None:
+                logger.info(f"Reusing saved results for {sanitize_url_for_log(url)} from {session_dir.name}")
+                st.success("✅ This video was already processed - showing saved results. Tick \"Reprocess\" to run it again.")
+            else:
+                # Create progress tracking
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                
+                # Callback function to update UI
+                def update_ui(progress: int, message: str):
+                    """Update progress bar and status text from processing function."""
+                    progress_bar.progress(progress)
+                    status_text.text(message)
+                
+                # Call business logic function with progress callback
+                results = process_youtube_video(url, session_dir, progress_callback=update_ui, use_local_gpu=use_local_gpu)
+                
+                # Brief pause to show completion
+                time.sleep(0.5)
+                progress_bar.empty()
+                status_text.empty()
+                
+                st.success("✅ Processing complete!")
             
             # Save results to session state for persistent display
             st.session_state['youtube_results'] = results
@@ -3241,7 +4850,8 @@ if mode == "YouTube Video":
             render_youtube_results(results)
             metadata_summary = results.get("metadata", {})
             summary_title = metadata_summary.get("title") or metadata_summary.get("transcript_title") or session_dir.name
-            summary_words = metadata_summary.get("word_count") or len(results.get("full_text", "").split())
+            # process_youtube_video always records word_count, so no need to re-split the transcript
+            summary_words = metadata_summary.get("word_count", 0)
             record_sidebar_operation(
                 "Process Video",
                 "success",
@@ -3249,94 +4859,8 @@ if mode == "YouTube Video":
                 project_dir=session_dir.name
             )
 
-        except AudioDownloadError as e:
-            record_sidebar_operation(
-                "Process Video",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
-            )
-            st.error(f"❌ **Download Failed**")
-            st.error(str(e))
-            st.info("**Suggestions:**\n"
-                   "- Verify the video is public and available\n"
-                   "- Check if the video is available in your region\n"
-                   "- Try a different video URL")
-            logger.error(f"Audio download error: {e}")
-            
-        except FileSizeError as e:
-            record_sidebar_operation(
-                "Process Video",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
-            )
-            st.error(f"❌ **File Too Large**")
-            st.error(str(e))
-            st.info("**Suggestions:**\n"
-                   "- Try a shorter video (under 30 minutes)\n"
-                   "- Lower the audio quality in your .env file (AUDIO_QUALITY=64)\n"
-                   "- The Whisper API has a 25MB file size limit")
-            logger.error(f"File size error: {e}")
-            
-        except TranscriptionError as e:
-            record_sidebar_operation(
-                "Process Video",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
-            )
-            st.error(f"❌ **Transcription Failed**")
-            st.error(str(e))
-            st.info("**Suggestions:**\n"
-                   "- Check that your OpenAI API key is valid\n"
-                   "- Ensure you have API credits available\n"
-                   "- Visit: https://platform.openai.com/usage")
-            logger.error(f"Transcription error: {e}")
-            
-        except APIQuotaError as e:
-            record_sidebar_operation(
-                "Process Video",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
-            )
-            st.error(f"❌ **API Quota Exceeded**")
-            st.error(str(e))
-            st.warning("**What to do:**\n"
-                      "1. Check your OpenAI usage dashboard\n"
-                      "2. Add credits or upgrade your plan\n"
-                      "3. Wait for your rate limit to reset\n"
-                      "4. Visit: https://platform.openai.com/usage")
-            logger.error(f"API quota error: {e}")
-            
-        except APIConnectionError as e:
-            record_sidebar_operation(
-                "Process Video",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
-            )
-            st.error(f"❌ **Connection Failed**")
-            st.error(str(e))
-            st.info("**Suggestions:**\n"
-                   "- Check your internet connection\n"
-                   "- Verify OpenAI services are operational\n"
-                   "- Check: https://status.openai.com/\n"
-                   "- Try again in a few moments")
-            logger.error(f"API connection error: {e}")
-            
         except Exception as e:
-            record_sidebar_operation(
-                "Process Video",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
-            )
-            st.error(f"❌ **Unexpected Error**")
-            st.error(str(e))
-            st.info("**Troubleshooting:**\n"
-                   "- Check the app.log file for details\n"
-                   "- Verify all dependencies are installed\n"
-                   "- Ensure FFmpeg is installed and in PATH\n"
-                   "- Try restarting the application")
-            logger.error(f"Unexpected error: {e}")
-            if st.checkbox("Show technical details"):
-                st.exception(e)
+            _report_processing_error("Process Video", e, _VIDEO_ERRORS, _VIDEO_UNEXPECTED_ERROR)
     
     # Display persistent results if available (even after clicking download buttons)
     if 'youtube_results' in st.session_state and not process_button:
@@ -3357,6 +4881,11 @@ else:  # Document File mode
         type=['pdf', 'docx', 'txt']
     )
     
+    reprocess_doc = st.checkbox(
+        "Reprocess",
+        key="reprocess_doc",
+        help="Process the document again even if it was already processed (the old results go to trash)"
+    )
     process_doc_button = st.button("Process Document")
     
     if process_doc_button:
@@ -3368,28 +4897,27 @@ else:  # Document File mode
             st.error("Please upload a document file.")
             st.stop()
         
+        # Rate limiting (shared with video processing, checked before validation)
+        _enforce_rate_limit()
+        
         # Validate file size (security: prevent memory exhaustion)
-        file_size_mb = uploaded_file.size / (1024 * 1024)
-        if file_size_mb > config.max_document_upload_mb:
+        if uploaded_file.size > _MAX_UPLOAD_BYTES:
+            file_size_mb = uploaded_file.size / (1024 * 1024)
             st.error(f"❌ **File Too Large**")
             st.error(f"File size: {file_size_mb:.1f}MB (Maximum: {config.max_document_upload_mb}MB)")
-            st.info("**Suggestions:**\n"
-                   "- Split large documents into smaller files\n"
-                   "- Remove unnecessary images or formatting\n"
-                   "- Convert to plain text format")
+            st.info(_UPLOAD_SIZE_HINTS)
             logger.warning(f"File upload rejected: {file_size_mb:.1f}MB exceeds limit")
             st.stop()
         
+        # Read the upload once; validation, hashing, and extraction share these bytes
+        raw_bytes = _read_upload_bytes(uploaded_file)
+        
         # Validate file content and security
-        is_valid, validation_error = validate_uploaded_file(uploaded_file)
+        is_valid, validation_error = validate_uploaded_file(uploaded_file, file_bytes=raw_bytes)
         if not is_valid:
             st.error(f"❌ **File Validation Failed**")
             st.error(validation_error)
-            st.info("**Suggestions:**\n"
-                   "- Ensure the file is a valid PDF, DOCX, or TXT file\n"
-                   "- Check that the file is not corrupted\n"
-                   "- Verify the file extension matches the actual file type\n"
-                   "- Avoid special characters in the filename")
+            st.info(_UPLOAD_VALIDATION_HINTS)
             logger.warning(f"File upload rejected: {validation_error} - {sanitize_url_for_log(uploaded_file.name)}")
             st.stop()
         
@@ -3399,44 +4927,35 @@ else:  # Document File mode
             message=f"{uploaded_file.name}",
         )
         
-        # Rate limiting (shared with video processing)
-        if 'last_process_time' not in st.session_state:
-            st.session_state.last_process_time = 0
-        
-        current_time = time.time()
-        time_since_last = current_time - st.session_state.last_process_time
-        if time_since_last < config.rate_limit_seconds:
-            wait_time = config.rate_limit_seconds - time_since_last
-            st.warning(f"⏳ Please wait {wait_time:.1f} more seconds before processing another request.")
-            st.stop()
-        
-        st.session_state.last_process_time = current_time
-        
         try:
-            # Create session directory
-            doc_id = safe_filename(str(uuid.uuid4()))
+            # Session directory is derived from name + content so resubmits reuse saved work
+            doc_id = derive_project_id(uploaded_file.name, raw_bytes)
             session_dir = config.output_dir / doc_id
-            session_dir.mkdir(exist_ok=True)
-            
-            # Create progress tracking
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+            results = claim_project_dir(session_dir, reprocess=reprocess_doc)
             
-            # Callback function to update UI
-            def update_ui(progress: int, message: str):
-                """Update progress bar and status text from processing function."""
-                progress_bar.progress(progress)
-                status_text.text(message)
-            
-            # Call business logic function with progress callback
-            results = process_document(uploaded_file, session_dir, progress_callback=update_ui)
-            
-            # Brief pause to show completion
-            time.sleep(0.5)
-            progress_bar.empty()
-            status_text.empty()
-            
-            st.success("✅ Processing complete!")
+            if results is not None:
+                logger.info(f"Reusing saved results for {uploaded_file.name} from {session_dir.name}")
+                st.success("✅ This document was already processed - showing saved results. Tick \"Reprocess\" to run it again.")
+            else:
+                # Create progress tracking
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                
+                # Callback function to update UI
+                def update_ui(progress: int, message: str):
+                    """Update progress bar and status text from processing function."""
+                    progress_bar.progress(progress)
+                    status_text.text(message)
+                
+                # Call business logic function with progress callback
+                results = process_document(raw_bytes, uploaded_file.name, session_dir, progress_callback=update_ui)
+                
+                # Brief pause to show completion
+                time.sleep(0.5)
+                progress_bar.empty()
+                status_text.empty()
+                
+                st.success("✅ Processing complete!")
             
             # Save results to session state for persistent display
             st.session_state['document_results'] = results
@@ -3449,67 +4968,11 @@ else:  # Document File mode
                 message=f"{uploaded_file.name}",
             )
         
-        except DocumentProcessingError as e:
-            record_sidebar_operation(
-                "Process Document",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
-            )
-            st.error(f"❌ **Document Processing Failed**")
-            st.error(str(e))
-            st.info("**Suggestions:**\n"
-                   "- Ensure the document is not corrupted\n"
-                   "- Try converting to a different format (PDF, DOCX, or TXT)\n"
-                   "- Check that the file contains readable text\n"
-                   "- Verify the file is not password-protected")
-            logger.error(f"Document processing error: {e}")
-            
-        except APIQuotaError as e:
-            record_sidebar_operation(
-                "Process Document",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
-            )
-            st.error(f"❌ **API Quota Exceeded**")
-            st.error(str(e))
-            st.warning("**What to do:**\n"
-                      "1. Check your OpenAI usage dashboard\n"
-                      "2. Add credits or upgrade your plan\n"
-                      "3. Wait for your rate limit to reset\n"
-                      "4. Visit: https://platform.openai.com/usage")
-            logger.error(f"API quota error: {e}")
-            
-        except APIConnectionError as e:
-            record_sidebar_operation(
-                "Process Document",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
-            )
-            st.error(f"❌ **Connection Failed**")
-            st.error(str(e))
-            st.info("**Suggestions:**\n"
-                   "- Check your internet connection\n"
-                   "- Verify OpenAI services are operational\n"
-                   "- Check: https://status.openai.com/\n"
-                   "- Try again in a few moments")
-            logger.error(f"API connection error: {e}")
-            
         except Exception as e:
-            record_sidebar_operation(
-                "Process Document",
-                "failed",
-                message=f"{type(e).__name__}: {e}"
+            _report_processing_error(
+                "Process Document", e, _DOCUMENT_ERRORS, _DOCUMENT_UNEXPECTED_ERROR,
+                details_key="doc_details"
             )
-            st.error(f"❌ **Unexpected Error**")
-            st.error(str(e))
-            st.info("**Troubleshooting:**\n"
-                   "- Check the app.log file for details\n"
-                   "- Verify all dependencies are installed (PyPDF2, python-docx)\n"
-                   "- Ensure the document format is supported\n"
-                   "- Try restarting the application")
-            logger.error(f"Unexpected document error: {e}")
-            if st.checkbox("Show technical details", key="doc_details"):
-                st.exception(e)
     
     # Display persistent results if available (even after clicking download buttons)
     if 'document_results' in st.session_state and not process_doc_button:
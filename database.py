@@ -5,6 +5,7 @@ Manages SQLite database for project storage, search, and organization.
 import json
 import logging
 import sqlite3
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -61,6 +62,12 @@ class Project:
 class DatabaseManager:
     """Manages all database operations for YouTube Analyzer."""
     
+    # Projects with no content title, or videos with no video title
+    _NEEDS_TITLE_PREDICATE = (
+        "content_title IS NULL OR content_title = '' "
+        "OR (type = 'youtube' AND (title IS NULL OR title = ''))"
+    )
+    
     def __init__(self, db_path: Path):
         """
         Initialize database manager.
@@ -70,8 +77,18 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_version = 0
         self._init_database()
     
+    @property
+    def write_version(self) -> int:
+        """Counter bumped by every project/tag write made through this manager."""
+        return self._write_version
+    
+    def _bump_write_version(self):
+        """Mark project listings read before this point as stale."""
+        self._write_version += 1
+    
     @contextmanager
     def get_connection(self):
         """
@@ -142,6 +159,34 @@ class DatabaseManager:
                 )
             """)
             
+            # Content-addressed cache of LLM responses (key is a digest of prompt + model)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key BLOB PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+            
+            # Transcripts keyed by a digest of the audio bytes + transcription settings
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS transcript_cache (
+                    key BLOB PRIMARY KEY,
+                    segments BLOB NOT NULL,
+                    text TEXT NOT NULL,
+                    created_at INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+            
+            # YouTube video titles fetched via yt-dlp, keyed by video ID
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS yt_title_cache (
+                    video_id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    fetched_at INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+            
             # Create indexes for better performance
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_projects_type ON projects(type)
@@ -152,6 +197,12 @@ class DatabaseManager:
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_projects_project_dir ON projects(project_dir)
             """)
+            # Partial index over projects still missing a title; must match the
+            # predicate in list_project_dirs_needing_titles() for SQLite to use it
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_projects_needs_title ON projects(id)
+                WHERE {self._NEEDS_TITLE_PREDICATE}
+            """)
             
             logger.info("Database initialized successfully")
     
@@ -220,6 +271,7 @@ class DatabaseManager:
                 self._add_tag_to_project(cursor, project_id, tag_name)
             
             logger.info(f"Inserted project {project_id}: {project.title}")
+            self._bump_write_version()
             
             # Clear tag cache if new tags were added
             if project.tags:
@@ -297,6 +349,29 @@ class DatabaseManager:
             """, values)
             
             logger.info(f"Updated project {project_id}")
+            self._bump_write_version()
+    
+    def update_project_titles(self, title_rows: List[Tuple[Optional[str], Optional[str], str]]) -> None:
+        """
+        Update video and content titles for several projects in one transaction.
+        
+        A None title leaves the stored value unchanged.
+        
+        Args:
+            title_rows: (title, content_title, project_dir) tuples
+        """
+        if not title_rows:
+            return
+        
+        with self.get_connection() as conn:
+            conn.executemany("""
+                UPDATE projects
+                SET title = COALESCE(?, title), content_title = COALESCE(?, content_title)
+                WHERE project_dir = ?
+            """, title_rows)
+            
+            logger.info(f"Updated titles for {len(title_rows)} projects")
+            self._bump_write_version()
     
     def delete_project(self, project_id: int):
         """
@@ -317,6 +392,33 @@ class DatabaseManager:
             cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
             
             logger.info(f"Deleted project {project_id}")
+            self._bump_write_version()
+    
+    def delete_projects(self, project_ids: List[int]) -> int:
+        """
+        Delete several projects from the database in a single transaction.
+        
+        Args:
+            project_ids: Project IDs to delete
+            
+        Returns:
+            Number of project rows deleted
+        """
+        if not project_ids:
+            return 0
+        
+        id_placeholders = ",".join("?" for _ in project_ids)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                DELETE FROM project_content_fts WHERE project_id IN ({id_placeholders})
+            """, project_ids)
+            cursor.execute(f"DELETE FROM projects WHERE id IN ({id_placeholders})", project_ids)
+            deleted = cursor.rowcount
+            
+            logger.info(f"Deleted {deleted} projects")
+            self._bump_write_version()
+            return deleted
     
     def get_project(self, project_id: int) -> Project:
         """
@@ -362,6 +464,23 @@ class DatabaseManager:
                 tags=tags
             )
     
+    def list_project_dirs_needing_titles(self) -> List[str]:
+        """
+        List projects that are still missing a video or content title.
+        
+        Answered from the partial index on the same predicate, so the check
+        stays cheap however many projects exist.
+        
+        Returns:
+            Project directory names of projects that need their titles filled in
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT project_dir FROM projects WHERE {self._NEEDS_TITLE_PREDICATE}
+            """)
+            return [row['project_dir'] for row in cursor.fetchall()]
+    
     def get_project_by_dir(self, project_dir: str) -> Optional[Project]:
         """
         Get a project by its directory name.
@@ -457,15 +576,21 @@ class DatabaseManager:
             cursor.execute(query, params)
             rows = cursor.fetchall()
             
+            # Fetch tags for every listed project in one query instead of one per row
+            tags_by_project: Dict[int, List[str]] = {row['id']: [] for row in rows}
+            if tags_by_project:
+                id_placeholders = ",".join("?" for _ in tags_by_project)
+                cursor.execute(f"""
+                    SELECT pt.project_id, t.name FROM tags t
+                    JOIN project_tags pt ON t.id = pt.tag_id
+                    WHERE pt.project_id IN ({id_placeholders})
+                """, list(tags_by_project))
+                for project_id, tag_name in cursor.fetchall():
+                    tags_by_project[project_id].append(tag_name)
+            
             projects = []
             for row in rows:
-                # Get tags for this project
-                cursor.execute("""
-                    SELECT t.name FROM tags t
-                    JOIN project_tags pt ON t.id = pt.tag_id
-                    WHERE pt.project_id = ?
-                """, (row['id'],))
-                project_tags = [r[0] for r in cursor.fetchall()]
+                project_tags = tags_by_project[row['id']]
                 
                 projects.append(Project(
                     id=row['id'],
@@ -546,6 +671,131 @@ class DatabaseManager:
                 'key_factors': row[2] or ''
             }
     
+    def get_llm_cache(self, key: bytes) -> Optional[str]:
+        """
+        Look up a cached LLM response.
+        
+        Args:
+            key: Digest identifying the prompt, model and parameters
+            
+        Returns:
+            Cached response text, or None on a miss
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT response FROM llm_cache WHERE key = ?", (key,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+    
+    def put_llm_cache(self, key: bytes, response: str):
+        """
+        Store an LLM response, replacing any previous entry for the key.
+        
+        Args:
+            key: Digest identifying the prompt, model and parameters
+            response: Response text to cache
+        """
+        with self.get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO llm_cache (key, response, created_at)
+                VALUES (?, ?, ?)
+            """, (key, response, int(time.time())))
+    
+    def purge_llm_cache(self, max_age_days: int) -> int:
+        """
+        Delete cached LLM responses older than the given age.
+        
+        Args:
+            max_age_days: Entries created more than this many days ago are removed
+            
+        Returns:
+            Number of entries deleted
+        """
+        cutoff = int(time.time()) - max_age_days * 86400
+        with self.get_connection() as conn:
+            cursor = conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (cutoff,))
+            if cursor.rowcount:
+                logger.info(f"Purged {cursor.rowcount} expired LLM cache entries")
+            return cursor.rowcount
+    
+    def get_transcript_cache(self, key: bytes) -> Optional[Tuple[bytes, str]]:
+        """
+        Look up a cached transcription.
+        
+        Args:
+            key: Digest identifying the audio and transcription settings
+            
+        Returns:
+            Tuple of (JSON-encoded segments, transcript text), or None on a miss
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT segments, text FROM transcript_cache WHERE key = ?", (key,))
+            row = cursor.fetchone()
+            return (row[0], row[1]) if row else None
+    
+    def put_transcript_cache(self, key: bytes, segments: bytes, text: str):
+        """
+        Store a transcription, replacing any previous entry for the key.
+        
+        Args:
+            key: Digest identifying the audio and transcription settings
+            segments: JSON-encoded list of segment dicts
+            text: Full transcript text
+        """
+        with self.get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO transcript_cache (key, segments, text, created_at)
+                VALUES (?, ?, ?, ?)
+            """, (key, segments, text, int(time.time())))
+    
+    def purge_transcript_cache(self, max_age_days: int) -> int:
+        """
+        Delete cached transcriptions older than the given age.
+        
+        Args:
+            max_age_days: Entries created more than this many days ago are removed
+            
+        Returns:
+            Number of entries deleted
+        """
+        cutoff = int(time.time()) - max_age_days * 86400
+        with self.get_connection() as conn:
+            cursor = conn.execute("DELETE FROM transcript_cache WHERE created_at < ?", (cutoff,))
+            if cursor.rowcount:
+                logger.info(f"Purged {cursor.rowcount} expired transcript cache entries")
+            return cursor.rowcount
+    
+    def get_yt_title_cache(self, video_id: str) -> Optional[Tuple[str, int]]:
+        """
+        Look up a cached YouTube video title.
+        
+        Args:
+            video_id: YouTube video ID
+            
+        Returns:
+            Tuple of (title, fetched_at unix time), or None on a miss
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT title, fetched_at FROM yt_title_cache WHERE video_id = ?", (video_id,))
+            row = cursor.fetchone()
+            return (row[0], row[1]) if row else None
+    
+    def put_yt_title_cache(self, video_id: str, title: str):
+        """
+        Store a freshly fetched YouTube video title.
+        
+        Args:
+            video_id: YouTube video ID
+            title: Video title as reported by yt-dlp
+        """
+        with self.get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO yt_title_cache (video_id, title, fetched_at)
+                VALUES (?, ?, ?)
+            """, (video_id, title, int(time.time())))
+    
     def add_tag(self, project_id: int, tag_name: str):
         """
         Add a tag to a project.
@@ -610,6 +860,7 @@ class DatabaseManager:
     def clear_tag_cache(self):
         """Clear the tag cache after modifications."""
         self.get_all_tags.cache_clear()
+        self._bump_write_version()
     
     def get_statistics(self) -> Dict[str, Any]:
         """
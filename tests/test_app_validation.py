@@ -69,11 +69,11 @@ def test_imports():
         'streamlit',
         'openai',
         'yt_dlp',
-        'PyPDF2',
+        'pypdfium2',
         'docx',
         'dotenv',
-        'chardet',
-        'pydub',
+        'orjson',
+        'charset_normalizer',
         'pandas',
         'faster_whisper'
     ]
@@ -0,0 +1,124 @@
+"""
+Tests for concurrent batch processing of YouTube videos and project directory claims.
+"""
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+import threading
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Import from app.py.py (the actual filename)
+import importlib.util
+spec = importlib.util.spec_from_file_location("app", Path(__file__).parent.parent / "app.py.py")
+app = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(app)
+
+
+class TestProcessYoutubeBatch:
+    """Test process_youtube_batch orchestration."""
+
+    URLS = [
+        "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+        "https://www.youtube.com/watch?v=bbbbbbbbbbb",
+        "https://www.youtube.com/watch?v=ccccccccccc",
+    ]
+
+    def test_results_keep_input_order_and_isolate_failures(self, tmp_path):
+        """A failing video is reported in its slot without stopping the others."""
+        started = []
+        lock = threading.Lock()
+
+        def fake_process(url, session_dir, progress_callback=None, use_local_gpu=False):
+            with lock:
+                started.append(url)
+            progress_callback(50, "halfway")
+            if url == self.URLS[1]:
+                raise app.AudioDownloadError("video unavailable")
+            return {"session_dir": session_dir, "metadata": {"url": url}}
+
+        progress = []
+        with patch.object(app, 'process_youtube_video', side_effect=fake_process):
+            items = app.process_youtube_batch(
+                self.URLS, progress_callback=lambda pct, msg: progress.append(pct), output_dir=tmp_path
+            )
+
+        assert [item["url"] for item in items] == self.URLS
+        assert items[0]["results"]["metadata"]["url"] == self.URLS[0]
+        assert isinstance(items[1]["error"], app.AudioDownloadError)
+        assert items[1]["results"] is None
+        assert items[2]["error"] is None
+        assert sorted(started) == sorted(self.URLS)
+        # Combined progress reaches 100 once every video has finished
+        assert progress[-1] == 100
+
+    def test_invalid_url_is_not_processed(self, tmp_path):
+        """Invalid URLs fail fast without calling the processing pipeline."""
+        with patch.object(app, 'process_youtube_video') as mock_process:
+            items = app.process_youtube_batch(["not a url"], output_dir=tmp_path)
+
+        assert isinstance(items[0]["error"], ValueError)
+        mock_process.assert_not_called()
+
+
+class TestClaimProjectDir:
+    """Test reuse and atomic claiming of project directories."""
+
+    @staticmethod
+    def _write_saved_project(session_dir):
+        session_dir.mkdir()
+        (session_dir / "metadata.json").write_bytes(b'{"url": "https://youtu.be/x", "title": "Saved"}')
+        for name in ("summary.txt", "key_factors.txt", "transcript.txt", "transcript_with_timestamps.txt"):
+            (session_dir / name).write_text("saved", encoding="utf-8")
+
+    def test_first_run_claims_and_second_is_rejected(self, tmp_path):
+        """Only one concurrent run gets the directory; the other is told it is in progress."""
+        session_dir = tmp_path / "project"
+
+        assert app.claim_project_dir(session_dir) is None
+        assert session_dir.is_dir()
+        with pytest.raises(app.ProjectInProgressError):
+            app.claim_project_dir(session_dir)
+
+    def test_claim_of_exited_process_is_taken_over(self, tmp_path):
+        """A directory left behind by a process that has exited is reclaimed."""
+        session_dir = tmp_path / "project"
+        assert app.claim_project_dir(session_dir) is None
+        (session_dir / "audio.mp3").write_bytes(b"partial")
+
+        with patch.object(app, '_process_is_running', return_value=False):
+            assert app.claim_project_dir(session_dir) is None
+
+        assert session_dir.is_dir()
+        assert not (session_dir / "audio.mp3").exists()
+
+    def test_completed_project_is_reused(self, tmp_path):
+        """Saved results are returned instead of claiming the directory again."""
+        session_dir = tmp_path / "project"
+        self._write_saved_project(session_dir)
+
+        results = app.claim_project_dir(session_dir)
+
+        assert results["metadata"]["title"] == "Saved"
+
+    def test_reprocess_replaces_saved_project(self, tmp_path):
+        """Reprocess trashes the saved project and claims a fresh directory."""
+        session_dir = tmp_path / "project"
+        self._write_saved_project(session_dir)
+
+        def fake_delete(name):
+            app.shutil.rmtree(tmp_path / name)
+            return app.DeletionResult(project_dir=name, disk_removed=True)
+
+        with patch.object(app, 'delete_project', side_effect=fake_delete) as mock_delete:
+            assert app.claim_project_dir(session_dir, reprocess=True) is None
+
+        mock_delete.assert_called_once_with("project")
+        assert session_dir.is_dir()
+        assert not (session_dir / "metadata.json").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
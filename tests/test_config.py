@@ -119,6 +119,14 @@ class TestConfigEnvironmentVariables:
         config = Config()
         assert config.openai_model == "gpt-4"
     
+    def test_worker_limits_from_env(self, monkeypatch):
+        """Test that concurrency and rate limits are read when Config is built."""
+        monkeypatch.setenv("WHISPER_RPM", "10")
+        monkeypatch.setenv("BATCH_MAX_WORKERS", "2")
+        config = Config()
+        assert config.whisper_requests_per_minute == 10
+        assert config.batch_max_workers == 2
+    
     def test_invalid_audio_quality_from_env(self, monkeypatch):
         """Test that invalid env value raises error."""
         monkeypatch.setenv("AUDIO_QUALITY", "1000")
@@ -149,6 +157,13 @@ class TestConfigIntegration:
         assert isinstance(config.max_audio_file_size_mb, int)
         assert isinstance(config.rate_limit_seconds, int)
     
+    def test_config_rejects_mutation(self):
+        """Test that config fields cannot be reassigned after creation."""
+        import dataclasses
+        config = Config()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.audio_quality = 128
+    
     def test_multiple_config_instances(self):
         """Test creating multiple config instances."""
         config1 = Config(audio_quality=96)
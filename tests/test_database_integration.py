@@ -193,6 +193,122 @@ def test_database():
         
         return True
 
+def test_llm_cache(tmp_path):
+    """LLM responses round-trip through the cache and expire on purge"""
+    db_manager = DatabaseManager(tmp_path / "test.db")
+    key = b"\x01" * 16
+    
+    assert db_manager.get_llm_cache(key) is None
+    db_manager.put_llm_cache(key, "first")
+    db_manager.put_llm_cache(key, "second")
+    assert db_manager.get_llm_cache(key) == "second"
+    
+    # Fresh entries survive a purge; anything older than the cutoff is removed
+    assert db_manager.purge_llm_cache(max_age_days=30) == 0
+    assert db_manager.purge_llm_cache(max_age_days=-1) == 1
+    assert db_manager.get_llm_cache(key) is None
+
+
+def test_write_version_tracks_project_writes(tmp_path):
+    """Project and tag writes bump the listing version; reads and cache writes do not"""
+    db_manager = DatabaseManager(tmp_path / "test.db")
+    version = db_manager.write_version
+    
+    project_id = db_manager.insert_project(Project(
+        type='youtube', title='Versioned', source='https://youtube.com/watch?v=abc',
+        project_dir='versioned_dir', word_count=1, segment_count=1
+    ))
+    assert db_manager.write_version > version
+    
+    version = db_manager.write_version
+    db_manager.list_projects()
+    db_manager.put_llm_cache(b"\x03" * 16, "cached")
+    assert db_manager.write_version == version
+    
+    db_manager.add_tag(project_id, 'AI')
+    assert db_manager.write_version > version
+    
+    version = db_manager.write_version
+    db_manager.delete_project(project_id)
+    assert db_manager.write_version > version
+
+
+def test_list_project_dirs_needing_titles(tmp_path):
+    """Projects are listed while they lack titles and drop out once they are filled in"""
+    db_manager = DatabaseManager(tmp_path / "test.db")
+    assert db_manager.list_project_dirs_needing_titles() == []
+    
+    project_id = db_manager.insert_project(Project(
+        type='youtube', title='Video', source='https://youtube.com/watch?v=xyz',
+        project_dir='untitled_dir', word_count=1, segment_count=1
+    ))
+    db_manager.insert_project(Project(
+        type='youtube', title='Titled', content_title='Done', source='https://youtube.com/watch?v=abc',
+        project_dir='titled_dir', word_count=1, segment_count=1
+    ))
+    assert db_manager.list_project_dirs_needing_titles() == ['untitled_dir']
+    
+    db_manager.update_project(project_id, content_title='Generated Title')
+    assert db_manager.list_project_dirs_needing_titles() == []
+
+
+def test_update_project_titles(tmp_path):
+    """Titles are written by project_dir; None keeps the stored value"""
+    db_manager = DatabaseManager(tmp_path / "test.db")
+    project_id = db_manager.insert_project(Project(
+        type='youtube', title='Original', source='https://youtube.com/watch?v=ttl',
+        project_dir='titles_dir', word_count=1, segment_count=1
+    ))
+    
+    db_manager.update_project_titles([(None, 'Generated', 'titles_dir'), ('X', 'Y', 'missing_dir')])
+    project = db_manager.get_project(project_id)
+    assert project.title == 'Original'
+    assert project.content_title == 'Generated'
+
+
+def test_delete_projects_bulk(tmp_path):
+    """Several projects are removed in one call; unrelated rows are kept"""
+    db_manager = DatabaseManager(tmp_path / "test.db")
+    project_ids = [
+        db_manager.insert_project(Project(
+            type='document', title=f'Doc {i}', source=f'doc_{i}.txt',
+            project_dir=f'bulk_dir_{i}', word_count=1
+        ), transcript=f"text {i}")
+        for i in range(3)
+    ]
+    
+    assert db_manager.delete_projects(project_ids[:2]) == 2
+    assert db_manager.delete_projects([]) == 0
+    assert [p.id for p in db_manager.list_projects()] == [project_ids[2]]
+
+
+def test_transcript_cache(tmp_path):
+    """Transcriptions round-trip through the cache and expire on purge"""
+    db_manager = DatabaseManager(tmp_path / "test.db")
+    key = b"\x02" * 16
+    segments = b'[{"start": 0.0, "end": 1.5, "text": "hello"}]'
+    
+    assert db_manager.get_transcript_cache(key) is None
+    db_manager.put_transcript_cache(key, segments, "hello")
+    assert db_manager.get_transcript_cache(key) == (segments, "hello")
+    
+    assert db_manager.purge_transcript_cache(max_age_days=30) == 0
+    assert db_manager.purge_transcript_cache(max_age_days=-1) == 1
+    assert db_manager.get_transcript_cache(key) is None
+
+
+def test_yt_title_cache(tmp_path):
+    """Video titles round-trip through the cache and are replaced on refresh"""
+    db_manager = DatabaseManager(tmp_path / "test.db")
+    
+    assert db_manager.get_yt_title_cache("dQw4w9WgXcQ") is None
+    db_manager.put_yt_title_cache("dQw4w9WgXcQ", "Old Title")
+    db_manager.put_yt_title_cache("dQw4w9WgXcQ", "New Title")
+    title, fetched_at = db_manager.get_yt_title_cache("dQw4w9WgXcQ")
+    assert title == "New Title"
+    assert fetched_at > 0
+
+
 if __name__ == '__main__':
     try:
         success = test_database()
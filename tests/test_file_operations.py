@@ -189,5 +189,30 @@ class TestTextValidation:
         assert result == text
 
 
+class TestExtractTextFromTxt:
+    """Test text file decoding with encoding detection."""
+    
+    def test_utf8_text(self):
+        """Test that UTF-8 text decodes directly."""
+        from app import extract_text_from_txt
+        
+        assert extract_text_from_txt("Grüße, 世界\n".encode("utf-8")) == "Grüße, 世界\n"
+    
+    @pytest.mark.parametrize("encoding, line", [
+        ("shift_jis", "これは日本語のテキストファイルです。文字コードの判定を確認します。"),
+        ("gbk", "这是一个中文文本文件，用于测试字符编码检测功能是否正常。"),
+    ])
+    def test_legacy_encoding_longer_than_sample(self, encoding, line):
+        """Test that multibyte files larger than the detection sample decode correctly."""
+        from app import extract_text_from_txt, _ENCODING_SAMPLE_BYTES
+        
+        # One long line, offset by a byte, so the sample boundary splits a character
+        text = "x" + line * 3000
+        file_bytes = text.encode(encoding)
+        assert len(file_bytes) > _ENCODING_SAMPLE_BYTES
+        
+        assert extract_text_from_txt(file_bytes) == text
+
+
 # Run with: pytest tests/test_file_operations.py -v
 
@@ -196,6 +196,27 @@ class TestFileValidation:
         is_valid, error = validate_uploaded_file(file_obj)
         assert is_valid is True
         assert error == ""
+    
+    def test_prefetched_bytes_skip_read(self):
+        """Test that already-read bytes are validated without reading the file again."""
+        pdf_content = b'%PDF-1.4\n' + b'x' * 100
+        file_obj = MockUploadedFile("document.pdf", pdf_content)
+        file_obj.read = Mock(side_effect=AssertionError("file should not be re-read"))
+        
+        is_valid, error = validate_uploaded_file(file_obj, file_bytes=pdf_content)
+        assert is_valid is True
+        assert error == ""
+    
+    def test_buffered_upload_uses_getvalue(self):
+        """Test that in-memory uploads are validated from getvalue() without a read."""
+        pdf_content = b'%PDF-1.4\n' + b'x' * 100
+        file_obj = BytesIO(pdf_content)
+        file_obj.name = "document.pdf"
+        file_obj.read = Mock(side_effect=AssertionError("file should not be read"))
+        
+        is_valid, error = validate_uploaded_file(file_obj)
+        assert is_valid is True
+        assert error == ""
 
 
 # Run with: pytest tests/test_file_validation.py -v
@@ -10,8 +10,10 @@ Tests cover:
 """
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 import sys
 import os
+import time
 
 # Add parent directory to path to import app module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -25,7 +27,12 @@ try:
         format_timestamp,
         format_url_for_display,
         truncate_title,
-        to_srt
+        to_srt,
+        write_transcript_files,
+        derive_project_id,
+        remove_tree_in_background,
+        write_output_files,
+        RateLimiter
     )
 except ImportError:
     # If module name is different, try alternative
@@ -41,6 +48,11 @@ except ImportError:
     format_url_for_display = app.format_url_for_display
     truncate_title = app.truncate_title
     to_srt = app.to_srt
+    write_transcript_files = app.write_transcript_files
+    derive_project_id = app.derive_project_id
+    remove_tree_in_background = app.remove_tree_in_background
+    write_output_files = app.write_output_files
+    RateLimiter = app.RateLimiter
 
 
 class TestSafeFilename:
@@ -172,6 +184,16 @@ class TestExtractVideoId:
         assert extract_video_id("https://youtu.be/abc123") == "abc123"
         assert extract_video_id("https://youtu.be/xyz789?t=30") == "xyz789"
     
+    def test_v_parameter_not_first(self):
+        """Test extraction when v is not the first query parameter."""
+        assert extract_video_id("https://youtube.com/watch?feature=share&v=abc123") == "abc123"
+        assert extract_video_id("https://youtube.com/watch?vv=nope&v=abc123") == "abc123"
+    
+    def test_v_parameter_matches_parse_qs(self):
+        """Test that blank v values are skipped and encoded ids are decoded, as parse_qs does."""
+        assert extract_video_id("https://youtube.com/watch?v=&v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert extract_video_id("https://youtube.com/watch?v=dQw4w9WgX%63Q") == "dQw4w9WgXcQ"
+    
     def test_youtube_shorts(self):
         """Test extraction from YouTube Shorts URLs."""
         assert extract_video_id("https://www.youtube.com/shorts/abc123") == "abc123"
@@ -209,6 +231,14 @@ class TestFormatTimestamp:
     def test_large_values(self):
         """Test formatting with large time values."""
         assert format_timestamp(10000) == "02:46:40.000"
+    
+    def test_rounding_carries_into_next_unit(self):
+        """Test milliseconds that round up carry into seconds and minutes."""
+        assert format_timestamp(59.9996) == "00:01:00.000"
+    
+    def test_srt_separator(self):
+        """Test SRT-style comma separator."""
+        assert format_timestamp(3661.25, ",") == "01:01:01,250"
 
 
 class TestFormatUrlForDisplay:
@@ -307,8 +337,116 @@ class TestToSrt:
         result = to_srt(segments)
         assert "Text with spaces" in result
         assert "  Text with spaces  " not in result
+    
+    def test_streamed_files_match_to_srt(self, tmp_path):
+        """Test that the single-pass writer produces the same SRT as to_srt."""
+        segments = [
+            {"start": 0.0, "end": 2.5, "text": " First "},
+            {"start": 3661.25, "end": 3662.0, "text": "Second"},
+        ]
+        text = write_transcript_files(segments, tmp_path / "ts.txt", tmp_path / "out.srt")
+        
+        assert (tmp_path / "out.srt").read_text(encoding="utf-8") == to_srt(segments)
+        assert (tmp_path / "ts.txt").read_text(encoding="utf-8") == text
+        assert text == (
+            "[00:00:00.000 → 00:00:02.500]\nFirst\n\n"
+            "[01:01:01.250 → 01:01:02.000]\nSecond\n"
+        )
+
+
+class TestRemoveTreeInBackground:
+    """Test non-blocking directory cleanup."""
+    
+    def test_path_is_free_immediately(self, tmp_path):
+        """Test that the original path can be reused as soon as the call returns."""
+        target = tmp_path / "session"
+        (target / "chunks").mkdir(parents=True)
+        (target / "chunks" / "chunk_000.mp3").write_bytes(b"x")
+        
+        remove_tree_in_background(target)
+        assert not target.exists()
+        target.mkdir()  # A new run can recreate the directory right away
+        
+        deadline = time.time() + 5
+        while len(list(tmp_path.iterdir())) > 1 and time.time() < deadline:
+            time.sleep(0.01)
+        assert list(tmp_path.iterdir()) == [target]
+    
+    def test_rename_failure_deletes_in_place(self, tmp_path):
+        """Test that a failed rename (e.g. an open file on Windows) still removes the tree."""
+        target = tmp_path / "session"
+        target.mkdir()
+        (target / "chunk_000.mp3").write_bytes(b"x")
+        
+        with patch.object(Path, "rename", side_effect=PermissionError("in use")):
+            remove_tree_in_background(target)
+        
+        assert not target.exists()
+
+
+class TestWriteOutputFiles:
+    """Test concurrent output file writes."""
+    
+    def test_writes_text_and_bytes(self, tmp_path):
+        """Test that text is written as UTF-8 and bytes verbatim."""
+        write_output_files([
+            ("summary", tmp_path / "summary.txt", "Résumé"),
+            ("metadata", tmp_path / "metadata.json", b'{"a": 1}'),
+        ])
+        assert (tmp_path / "summary.txt").read_text(encoding="utf-8") == "Résumé"
+        assert (tmp_path / "metadata.json").read_bytes() == b'{"a": 1}'
+    
+    def test_failure_names_file(self, tmp_path):
+        """Test that a failed write raises IOError naming the output."""
+        with pytest.raises(IOError, match="key factors"):
+            write_output_files([
+                ("summary", tmp_path / "summary.txt", "ok"),
+                ("key factors", tmp_path / "missing" / "key_factors.txt", "lost"),
+            ])
+
+
+class TestDeriveProjectId:
+    """Test stable project directory name derivation."""
+    
+    def test_same_input_same_id(self):
+        """Test that resubmitting the same source yields the same id."""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        assert derive_project_id(url) == derive_project_id(url)
+    
+    def test_different_input_different_id(self):
+        """Test that different sources yield different ids."""
+        assert derive_project_id("a.pdf", b"one") != derive_project_id("a.pdf", b"two")
+    
+    def test_part_boundaries_matter(self):
+        """Test that parts are not simply concatenated."""
+        assert derive_project_id("ab", "c") != derive_project_id("a", "bc")
+    
+    def test_id_is_safe_filename(self):
+        """Test that the id is a fixed-length hex string."""
+        project_id = derive_project_id("https://youtu.be/dQw4w9WgXcQ")
+        assert len(project_id) == 24
+        assert safe_filename(project_id) == project_id
+
+
+class TestRateLimiter:
+    """Test the sliding-window request limiter."""
+    
+    def test_allows_burst_up_to_limit(self):
+        """Requests within the limit do not block."""
+        limiter = RateLimiter(3, period_seconds=60.0)
+        with patch("time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.acquire()
+        mock_sleep.assert_not_called()
+    
+    def test_blocks_until_window_frees(self):
+        """A request over the limit waits for the oldest slot to expire."""
+        limiter = RateLimiter(1, period_seconds=0.05)
+        limiter.acquire()
+        started = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - started >= 0.04
 
 
 # Run with: pytest tests/test_utilities.py -v
 # Coverage: pytest tests/test_utilities.py --cov=app --cov-report=html
-